@@ -6,12 +6,21 @@ objects from :mod:`~muve.sumo_server.sumo.manager`.
 from __future__ import annotations
 
 import abc
+import asyncio
 import ipaddress
+import multiprocessing
+import multiprocessing.connection
+import multiprocessing.context
+import multiprocessing.process
 import os
 import pathlib
-import subprocess  # noqa: S404, security
+import signal
+import stat
+import sys
+import threading
+import time
 from types import ModuleType
-from typing import ClassVar, Final, List, Optional, TypeVar, Union
+from typing import Callable, cast, ClassVar, Dict, Final, Iterable, List, Optional, Tuple, TypeVar
 from unittest import mock
 
 # libsumo refuses to install quickly for CI/CD unittests, if this environment variable is False just don't use it.
@@ -25,6 +34,102 @@ from muve.sumo_server.sumo.tcp import SumoTcpConnection
 
 StatusGuardedFuncType = TypeVar("StatusGuardedFuncType")
 
+#: Subscription results as returned by SUMO: a mapping of vehicle identifier to its subscribed variable values,
+#: keyed by the TraCI variable identifier.
+SubscriptionResults = Dict[str, Dict[int, object]]
+
+#: Reply sent back over a `libsumo` worker pipe: a status string paired with the command's result, which carries
+#: either the step's subscription results or an error message.
+_WorkerReply = Tuple[str, object]
+
+_MAX_CONCURRENT_SPAWNS_ENV_VAR: Final[str] = "SUMO_MAX_CONCURRENT_SPAWNS"
+
+#: Bounds how many SUMO processes may be spawned at the same time. Batch creation otherwise forks every process at
+#: once, thrashing the box under memory and disk-cache pressure when many instances are requested together.
+_SPAWN_SEMAPHORE: Final[threading.BoundedSemaphore] = threading.BoundedSemaphore(
+    int(os.getenv(_MAX_CONCURRENT_SPAWNS_ENV_VAR, "8")),
+)
+
+#: Set while a `libsumo` simulation is running anywhere in this process. `libsumo` supports a single simulation per
+#: process, so the flag is deliberately process-global; the event keeps both the check and the updates at C level.
+_LIBSUMO_ACTIVE: Final[threading.Event] = threading.Event()
+
+if sys.version_info >= (3, 9):
+    _waitstatus_to_exitcode = os.waitstatus_to_exitcode
+else:  # pragma: nocover
+    def _waitstatus_to_exitcode(status: int) -> int:
+        """Convert a :func:`os.waitpid` status to an exit code, like :func:`os.waitstatus_to_exitcode` on 3.9+.
+
+        :param status: Wait status as returned by :func:`os.waitpid`.
+
+        :returns: The process exit code, or the negated signal number when the process died to a signal.
+        """
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status)
+        return os.WEXITSTATUS(status)
+
+
+class SpawnedSumoProcess:
+    """Thin handle around a SUMO process created through :func:`os.posix_spawn`.
+
+    Exposes the small subset of the :class:`subprocess.Popen` interface that the rest of this package relies on,
+    without carrying the fork-based spawn machinery of :mod:`subprocess`.
+    """
+
+    __slots__ = ("_pid", "_returncode")
+
+    _pid: int
+    _returncode: Optional[int]
+
+    def __init__(self, pid: int) -> None:
+        """Initialize the process handle with the process identifier returned by :func:`os.posix_spawn`.
+
+        :param pid: Process identifier of the spawned SUMO process.
+        """
+        self._pid = pid
+        self._returncode = None
+
+    @property
+    def pid(self) -> int:
+        """Get the process identifier of the spawned SUMO process.
+
+        :returns: SUMO process identifier.
+        """
+        return self._pid
+
+    @property
+    def returncode(self) -> Optional[int]:
+        """Get the return code of the SUMO process if it has been reaped, otherwise `None`.
+
+        :returns: SUMO process return code if available.
+        """
+        return self._returncode
+
+    def poll(self) -> Optional[int]:
+        """Check whether the SUMO process has exited without blocking.
+
+        :returns: The process return code if it has exited, otherwise `None`.
+        """
+        if self._returncode is None:
+            pid, status = os.waitpid(self._pid, os.WNOHANG)
+            if pid == self._pid:
+                self._returncode = _waitstatus_to_exitcode(status)
+        return self._returncode
+
+    def wait(self) -> int:
+        """Block until the SUMO process exits and reap it.
+
+        :returns: The process return code.
+        """
+        if self._returncode is None:
+            _, status = os.waitpid(self._pid, 0)
+            self._returncode = _waitstatus_to_exitcode(status)
+        return self._returncode
+
+    def terminate(self) -> None:
+        """Send a termination signal to the SUMO process."""
+        os.kill(self._pid, signal.SIGTERM)
+
 
 class SumoInstance(abc.ABC):
     """Abstract SUMO instance interface.
@@ -37,24 +142,49 @@ class SumoInstance(abc.ABC):
 
     _CONFIGURATION_FLAG: Final[str] = "-c"
 
+    __slots__ = ("_config", "_is_started")
+
     _config: pathlib.Path
     _is_started: bool
 
-    def __init__(self, *, config: pathlib.Path) -> None:
+    def __init__(self, *, config: pathlib.Path, skip_validation: bool = False) -> None:
         """Initialize the abstract SUMO instance with a SUMO configuration.
 
         :param config: Path to the `sumocfg`_ configuration file.
+        :param skip_validation: Skip checking that the provided paths exist, for callers that have already validated
+            them (e.g. the instance manager); avoids a stat syscall per path on the instance creation path.
 
         :raises ValueError: The provided configuration path does not exist.
 
         .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
         """
-        if not config.exists():
-            raise ValueError(f"provided configuration file {config} does not exist")
+        if not skip_validation:
+            self._validate_file(config, "configuration")
 
         self._config = config
         self._is_started = False
 
+    @staticmethod
+    def _validate_file(path: pathlib.Path, description: str) -> None:
+        """Check that the supplied path names a regular file, in a single stat syscall.
+
+        :func:`os.path.isfile` performs the same single :func:`os.stat` but routes it through a wrapper that
+        swallows every :class:`OSError`; calling :func:`os.stat` directly keeps the construction path at exactly one
+        syscall and surfaces the failure through the exception instead of a second check.
+
+        :param path: Path to validate.
+        :param description: Human-readable description of the path, used in the error message.
+
+        :raises ValueError: The path does not exist or is not a regular file.
+        """
+        try:
+            mode = os.stat(path).st_mode
+        except OSError as e:
+            raise ValueError(f"provided {description} file {path} does not exist") from e
+
+        if not stat.S_ISREG(mode):
+            raise ValueError(f"provided {description} file {path} does not exist")
+
     @property
     def config(self) -> pathlib.Path:
         """Get the path to the SUMO configuration file used by this instance.
@@ -68,13 +198,23 @@ class SumoInstance(abc.ABC):
         """Start the interaction with SUMO."""
 
     @abc.abstractmethod
-    def step(self) -> None:
-        """Step the SUMO simulation."""
+    def step(self) -> Optional[SubscriptionResults]:
+        """Step the SUMO simulation.
+
+        :returns: The subscription results materialized by this step, if the instance supports subscriptions.
+        """
 
     @abc.abstractmethod
     def stop(self) -> None:
         """Stop the interaction with SUMO and clean up."""
 
+    def _release(self) -> None:
+        """Release reusable resources held by this instance back to shared caches before destruction.
+
+        The default implementation does nothing; subclasses holding resources worth reusing (e.g. established
+        connections) should override this.
+        """
+
 
 class LocalTcpSumoInstance(SumoInstance):
     """Manages a single local SUMO process and the related TCP socket connection for communication.
@@ -93,37 +233,70 @@ class LocalTcpSumoInstance(SumoInstance):
     _PORT_NUMBER_FLAG: Final[str] = "--remote-port"
     _NUM_CLIENTS_FLAG: Final[str] = "--num-clients"
     _NUM_CLIENTS: Final[int] = 1
+    _CONNECT_RETRIES: Final[int] = 10
+    _CONNECT_BACKOFF_SECONDS: Final[float] = 0.05
+
+    __slots__ = ("_executable", "_argv", "_port", "_cpu", "_process", "_connection")
 
     _executable: pathlib.Path
+    _argv: List[bytes]
     _port: int
-    _process: Optional[subprocess.Popen[bytes]]
+    _cpu: Optional[int]
+    _process: Optional[SpawnedSumoProcess]
     _connection: Optional[SumoTcpConnection]
 
-    def __init__(self, *, config: pathlib.Path, executable: pathlib.Path, port: int) -> None:
+    def __init__(
+        self,
+        *,
+        config: pathlib.Path,
+        executable: pathlib.Path,
+        port: int,
+        cpu: Optional[int] = None,
+        skip_validation: bool = False,
+    ) -> None:
         """Initialize a SUMO instance manager.
 
         :param config: Path to the `sumocfg`_ configuration file.
         :param executable: Path to the base SUMO executable.
         :param port: Port number to spawn and connect to the SUMO instance on.
+        :param cpu: CPU core to pin the spawned SUMO process to, or `None` to leave scheduling to the kernel.
+            Pinning keeps the connection state cache-hot on one core when the deployment dedicates cores to
+            instances; left unset it would only fight the scheduler.
+        :param skip_validation: Skip checking that the provided paths exist, for callers that have already validated
+            them (e.g. the instance manager).
 
         :raises ValueError: One or more of the provided paths does not exist.
 
         .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
         """
         try:
-            super().__init__(config=config)
+            super().__init__(config=config, skip_validation=skip_validation)
         except ValueError:
             raise
 
-        if not executable.exists():
-            raise ValueError(f"provided executable file {executable} does not exist")
+        if not skip_validation:
+            self._validate_file(executable, "executable")
 
         self._config = config
         self._executable = executable
         self._port = port
+        self._cpu = cpu
         self._process = None
         self._connection = None
 
+        # The spawn arguments are frozen at construction, so build the argv once here instead of redoing the
+        # stringifications and list allocation on every spawn. The arguments are stored filesystem-encoded since the
+        # exec machinery wants bytes anyway; encoding here skips that round-trip on every spawn.
+        self._argv = [
+            os.fsencode(executable),
+            os.fsencode(self._CONFIGURATION_FLAG),
+            os.fsencode(config),
+            os.fsencode(self._PORT_NUMBER_FLAG),
+            os.fsencode(str(port)),
+            os.fsencode(self._NUM_CLIENTS_FLAG),
+            os.fsencode(str(self._NUM_CLIENTS)),
+        ]
+
     @property
     def executable(self) -> pathlib.Path:
         """Get the path to the SUMO executable file used by this instance.
@@ -141,7 +314,7 @@ class LocalTcpSumoInstance(SumoInstance):
         return self._port
 
     @property
-    def process(self) -> subprocess.Popen[bytes]:
+    def process(self) -> SpawnedSumoProcess:
         """Try to get the spawned SUMO process. Errors if the SUMO process does not exist.
 
         :raises SumoProcessError: Associated SUMO process does not exist.
@@ -169,17 +342,43 @@ class LocalTcpSumoInstance(SumoInstance):
 
         This effectively starts the simulation; however, it will not run. See :meth:`~.step` to run the simulation.
 
+        If the subprocess or connection were already prepared ahead of time (e.g. by the warm pool in
+        :class:`~muve.sumo_server.sumo.manager.SumoInstanceManager`), they are adopted rather than recreated.
+
         :raises SumoStatusError: This instance is already running.
+        :raises SumoConnectionError: Could not connect to the SUMO process after all retries.
+        """
+        if self._is_started:
+            raise self.SumoStatusError("this SUMO instance is already started")
+
+        if not self._process:
+            self._spawn()
+        if not self._connection:
+            self._connect()
+
+        self._is_started = True
+
+    async def start_async(self) -> None:
+        """Start the interaction with SUMO without blocking the running event loop.
+
+        Behaves like :meth:`~.start`, but the TCP connection attempts overlap SUMO's own boot: connecting is retried
+        with exponential backoff while SUMO brings up its listener, and other instances can boot concurrently in the
+        meantime (e.g. via :func:`asyncio.gather`).
+
+        :raises SumoStatusError: This instance is already started.
+        :raises SumoConnectionError: Could not connect to the SUMO process after all retries.
         """
         if self._is_started:
             raise self.SumoStatusError("this SUMO instance is already started")
 
-        self._spawn()
-        self._connect()
+        if not self._process:
+            self._spawn()
+        if not self._connection:
+            await self._connect_async()
 
         self._is_started = True
 
-    def step(self) -> None:
+    def step(self) -> Optional[SubscriptionResults]:
         """Step the SUMO simulation.
 
         :raises NotImplementedError: Not implemented.
@@ -196,30 +395,111 @@ class LocalTcpSumoInstance(SumoInstance):
     def _spawn(self) -> None:
         """Spawn the SUMO process.
 
+        Uses :func:`os.posix_spawn` rather than :mod:`subprocess` so spawning avoids forking (and copying the page
+        tables of) the server process, keeping per-instance start latency independent of the server's memory size.
+
+        Concurrent spawns are bounded by a semaphore sized through the environment variable named by
+        :data:`~._MAX_CONCURRENT_SPAWNS_ENV_VAR`, so batch creation staggers its process storm. When a CPU core was
+        supplied at construction, the spawned process is pinned to it.
+
         :raises SumoProcessError: Something went wrong with creating the SUMO subprocess. The error is more
-            specialized, check out the `subprocess exceptions documentation`_ for more details.
-
-        .. _`subprocess exceptions documentation`: https://docs.python.org/3/library/subprocess.html#exceptions
-        """
-        args: List[Union[str, pathlib.Path]] = [
-            str(self.executable),
-            self._CONFIGURATION_FLAG,
-            str(self.config),
-            self._PORT_NUMBER_FLAG,
-            str(self.port),
-            self._NUM_CLIENTS_FLAG,
-            str(self._NUM_CLIENTS),
-        ]
+            specialized, check out the `os.posix_spawn documentation`_ for more details.
 
-        try:
-            self._process = subprocess.Popen(args)  # noqa: S603, security
-        except subprocess.SubprocessError as e:
-            raise self.SumoProcessError(e)
+        .. _`os.posix_spawn documentation`: https://docs.python.org/3/library/os.html#os.posix_spawn
+        """
+        with _SPAWN_SEMAPHORE:
+            try:
+                pid = os.posix_spawn(self._argv[0], self._argv, os.environ)  # noqa: S606, security
+            except OSError as e:
+                raise self.SumoProcessError(e)
+
+        if self._cpu is not None:
+            # Best effort: affinity control is platform-specific and the allowed set can be restricted by cgroups.
+            try:
+                os.sched_setaffinity(pid, {self._cpu})
+            except (AttributeError, OSError):  # pragma: nocover
+                pass
+
+        self._process = SpawnedSumoProcess(pid)
+
+    def _release(self) -> None:
+        """Return this instance's established connection to the shared connection pool.
+
+        The next instance connecting to the same address adopts the connection and skips the TCP handshake.
+        """
+        if self._connection is not None:
+            self._connection.release()
+            self._connection = None
 
     def _connect(self) -> None:
-        """Connect to the SUMO instance over a TCP socket."""
-        self._connection = SumoTcpConnection(self.LOCAL_HOST, self.port)
-        self._connection.connect()
+        """Connect to the SUMO instance over a TCP socket, retrying with exponential backoff while SUMO boots.
+
+        A pooled connection is adopted when one is available, skipping the handshake entirely. Otherwise connecting
+        is retried: a freshly spawned SUMO refuses connections until it binds its listener, so the first attempts
+        routinely fail on loopback even though the process is healthy.
+
+        :raises SumoProcessError: The SUMO process exited before its listener came up, so further retries are
+            pointless; failing here avoids waiting out the whole backoff schedule on a dead process.
+        :raises SumoConnectionError: Could not connect to the SUMO process after all retries.
+        """
+        pooled_connection = SumoTcpConnection._pop_pooled(self.LOCAL_HOST, self.port)
+        if pooled_connection is not None:
+            self._connection = pooled_connection
+            return
+
+        backoff = self._CONNECT_BACKOFF_SECONDS
+        for _ in range(self._CONNECT_RETRIES):
+            connection = SumoTcpConnection(self.LOCAL_HOST, self.port)
+            try:
+                connection.connect()
+            except SumoTcpConnection.SumoSocketError:
+                if self._process is not None and self._process.poll() is not None:
+                    raise self.SumoProcessError(
+                        f"SUMO process exited with code {self._process.returncode} before accepting a connection",
+                    )
+
+                time.sleep(backoff)
+                backoff *= 2
+            else:
+                self._connection = connection
+                return
+
+        raise self.SumoConnectionError(
+            f"could not connect to the SUMO process on port {self.port} after {self._CONNECT_RETRIES} attempts",
+        )
+
+    async def _connect_async(self) -> None:
+        """Connect to the SUMO instance over a TCP socket, retrying with exponential backoff while SUMO boots.
+
+        :raises SumoProcessError: The SUMO process exited before its listener came up, so further retries are
+            pointless; failing here avoids waiting out the whole backoff schedule on a dead process.
+        :raises SumoConnectionError: Could not connect to the SUMO process after all retries.
+        """
+        pooled_connection = SumoTcpConnection._pop_pooled(self.LOCAL_HOST, self.port)
+        if pooled_connection is not None:
+            self._connection = pooled_connection
+            return
+
+        backoff = self._CONNECT_BACKOFF_SECONDS
+        for _ in range(self._CONNECT_RETRIES):
+            connection = SumoTcpConnection(self.LOCAL_HOST, self.port)
+            try:
+                await connection.connect_async()
+            except SumoTcpConnection.SumoSocketError:
+                if self._process is not None and self._process.poll() is not None:
+                    raise self.SumoProcessError(
+                        f"SUMO process exited with code {self._process.returncode} before accepting a connection",
+                    )
+
+                await asyncio.sleep(backoff)
+                backoff *= 2
+            else:
+                self._connection = connection
+                return
+
+        raise self.SumoConnectionError(
+            f"could not connect to the SUMO process on port {self.port} after {self._CONNECT_RETRIES} attempts",
+        )
 
 
 class LocalLibSumoInstance(SumoInstance):
@@ -236,22 +516,38 @@ class LocalLibSumoInstance(SumoInstance):
 
     _libsumo: Final[ModuleType] = libsumo
 
-    _exists_started: ClassVar[bool] = False
+    __slots__ = ("_simulation_step", "_subscription_results")
 
-    def __init__(self, *, config: pathlib.Path) -> None:
+    _simulation_step: Optional[Callable[[], object]]
+    _subscription_results: Optional[Callable[[], SubscriptionResults]]
+
+    @classmethod
+    def _exists_started(cls) -> bool:
+        """Check whether a `libsumo` simulation is currently running in this process.
+
+        :returns: Whether the one-per-process `libsumo` simulation slot is taken.
+        """
+        return _LIBSUMO_ACTIVE.is_set()
+
+    def __init__(self, *, config: pathlib.Path, skip_validation: bool = False) -> None:
         """Initialize the `libsumo` SUMO instance with a SUMO configuration.
 
         :param config: Path to the `sumocfg`_ configuration file.
+        :param skip_validation: Skip checking that the provided paths exist, for callers that have already validated
+            them (e.g. the instance manager).
 
         :raises ValueError: The provided configuration path does not exist.
 
         .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
         """
         try:
-            super().__init__(config=config)
+            super().__init__(config=config, skip_validation=skip_validation)
         except ValueError:
             raise
 
+        self._simulation_step = None
+        self._subscription_results = None
+
     def start(self) -> None:
         """Start the interaction with SUMO.
 
@@ -260,7 +556,7 @@ class LocalLibSumoInstance(SumoInstance):
         """
         if self._is_started:
             raise self.SumoStatusError("this SUMO instance is already started")
-        if LocalLibSumoInstance._exists_started:
+        if _LIBSUMO_ACTIVE.is_set():
             raise self.SumoLibError("`libsumo` only supports one simulation running at a time")
 
         try:
@@ -273,20 +569,50 @@ class LocalLibSumoInstance(SumoInstance):
             raise self.SumoLibError(e)  # type: ignore
 
         self._is_started = True
-        LocalLibSumoInstance._exists_started = True
+        _LIBSUMO_ACTIVE.set()
+
+        # Cache the bound `libsumo` entry points used on the per-tick hot path so that `step` does not redo the
+        # module and submodule attribute lookups on every simulation tick.
+        self._simulation_step = self._libsumo.simulation.step  # type: ignore
+        self._subscription_results = self._libsumo.vehicle.getAllSubscriptionResults  # type: ignore
 
-    def step(self) -> None:
+    def subscribe(self, vehicle_ids: Iterable[str], variable_ids: List[int]) -> None:
+        """Subscribe to SUMO variables for the given vehicles.
+
+        Subscribed values are materialized by SUMO on every simulation tick and returned by :meth:`~.step`, avoiding
+        a separate retrieval round-trip per vehicle and variable.
+
+        :param vehicle_ids: Identifiers of the vehicles to subscribe to.
+        :param variable_ids: TraCI variable identifiers to subscribe to for each vehicle.
+
+        :raises SumoStatusError: This instance is not running.
+        :raises SumoLibError: Subscribing caused an exception with the SUMO library.
+        """
+        if not self._is_started:
+            raise self.SumoStatusError("this SUMO instance is not started")
+
+        try:
+            for vehicle_id in vehicle_ids:
+                self._libsumo.vehicle.subscribe(vehicle_id, variable_ids)  # type: ignore
+        except self._libsumo.TraCIException as e:  # type: ignore
+            raise self.SumoLibError(e)  # type: ignore
+
+    def step(self) -> SubscriptionResults:
         """Step the SUMO simulation.
 
         :raises SumoStatusError: This instance is not running.
         :raises SumoLibError: Stepping caused an exception with the SUMO library.
+
+        :returns: The subscription results materialized by this step, see :meth:`~.subscribe`.
         """
-        if not self._is_started:
+        simulation_step = self._simulation_step
+        subscription_results = self._subscription_results
+        if not self._is_started or not simulation_step or not subscription_results:
             raise self.SumoStatusError("this SUMO instance is not started")
 
         try:
-            # NOTE: this returns subscription values, consider parsing them.
-            self._libsumo.simulation.step()  # type: ignore
+            simulation_step()
+            return subscription_results()
         except self._libsumo.TraCIException as e:  # type: ignore
             self.stop()
             raise self.SumoLibError(e)  # type: ignore
@@ -306,4 +632,212 @@ class LocalLibSumoInstance(SumoInstance):
             raise self.SumoLibError(e)  # type: ignore
         finally:
             self._is_started = False
-            LocalLibSumoInstance._exists_started = False
+            self._simulation_step = None
+            self._subscription_results = None
+            _LIBSUMO_ACTIVE.clear()
+
+
+class MultiprocessLibSumoInstance(SumoInstance):
+    """Runs a `libsumo`_ simulation inside a dedicated worker process.
+
+    `libsumo`_ supports a single running simulation per process, so :class:`~.LocalLibSumoInstance` is limited to one
+    instance server-wide. Hosting each simulation in its own worker process lifts that limit: commands are marshalled
+    over a :func:`multiprocessing.Pipe` (a Unix socketpair under the hood) to a worker that owns its own `libsumo`,
+    and many such workers can run concurrently.
+
+    Do not manually instantiate this class, use
+    :meth:`~muve.sumo_server.sumo.manager.SumoInstanceManager.create_instance` instead.
+
+    .. _`libsumo`: https://sumo.dlr.de/docs/Libsumo.html
+    """
+
+    class SumoWorkerError(Exception):
+        """Raised when something goes wrong with the `libsumo` worker process."""
+
+    _libsumo: Final[ModuleType] = libsumo
+
+    _START_COMMAND: Final[str] = "start"
+    _STEP_COMMAND: Final[str] = "step"
+    _STOP_COMMAND: Final[str] = "stop"
+    _OK_STATUS: Final[str] = "ok"
+    _ERROR_STATUS: Final[str] = "error"
+
+    #: Lazily created multiprocessing context that worker processes are launched from; `None` until the first worker.
+    _context: ClassVar[Optional[multiprocessing.context.BaseContext]] = None
+
+    __slots__ = ("_worker_process", "_channel")
+
+    _worker_process: Optional[multiprocessing.process.BaseProcess]
+    _channel: Optional[multiprocessing.connection.Connection[str, _WorkerReply]]
+
+    @classmethod
+    def _worker_context(cls) -> multiprocessing.context.BaseContext:
+        """Get the multiprocessing context used to launch worker processes, creating it on first use.
+
+        Prefers the `forkserver` start method with `libsumo` preloaded into the fork server: every worker then forks
+        from a small process that has already paid the `libsumo` import cost once, instead of re-importing it (or
+        inheriting the whole server image) per instance. Falls back to the platform default start method where
+        `forkserver` is unavailable.
+
+        :returns: The context worker processes and their pipes are created from.
+        """
+        if cls._context is None:
+            try:
+                context: multiprocessing.context.BaseContext = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(["libsumo"])
+            except ValueError:
+                context = multiprocessing.get_context()
+            cls._context = context
+        return cls._context
+
+    def __init__(self, *, config: pathlib.Path, skip_validation: bool = False) -> None:
+        """Initialize the multiprocess `libsumo` SUMO instance with a SUMO configuration.
+
+        :param config: Path to the `sumocfg`_ configuration file.
+        :param skip_validation: Skip checking that the provided paths exist, for callers that have already validated
+            them (e.g. the instance manager).
+
+        :raises ValueError: The provided configuration path does not exist.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        """
+        try:
+            super().__init__(config=config, skip_validation=skip_validation)
+        except ValueError:
+            raise
+
+        self._worker_process = None
+        self._channel = None
+
+    def start(self) -> None:
+        """Start the worker process and the `libsumo` simulation inside it.
+
+        :raises SumoStatusError: This instance is already running.
+        :raises SumoWorkerError: The worker could not start the simulation.
+        """
+        if self._is_started:
+            raise self.SumoStatusError("this SUMO instance is already started")
+
+        context = self._worker_context()
+        # The multiprocessing primitives are untyped; pin the pipe ends down here so everything downstream of them
+        # stays checked.
+        channel: multiprocessing.connection.Connection[str, _WorkerReply]
+        worker_channel: multiprocessing.connection.Connection[_WorkerReply, str]
+        channel, worker_channel = context.Pipe()  # type: ignore
+        process: multiprocessing.process.BaseProcess = context.Process(  # type: ignore
+            target=self._worker,
+            args=(worker_channel, self.config),
+            daemon=True,
+        )
+        process.start()
+        worker_channel.close()
+
+        self._worker_process = process
+        self._channel = channel
+
+        try:
+            self._request(self._START_COMMAND)
+        except self.SumoWorkerError:
+            channel.close()
+            process.terminate()
+            process.join()
+            self._worker_process = None
+            self._channel = None
+            raise
+
+        self._is_started = True
+
+    def step(self) -> SubscriptionResults:
+        """Step the SUMO simulation in the worker process.
+
+        :raises SumoStatusError: This instance is not running.
+        :raises SumoWorkerError: Stepping caused an exception in the worker.
+
+        :returns: The subscription results materialized by this step.
+        """
+        if not self._is_started:
+            raise self.SumoStatusError("this SUMO instance is not started")
+
+        return cast(SubscriptionResults, self._request(self._STEP_COMMAND))
+
+    def stop(self) -> None:
+        """Stop the simulation and shut the worker process down.
+
+        :raises SumoStatusError: This instance is not running.
+        :raises SumoWorkerError: Stopping caused an exception in the worker.
+        """
+        if not self._is_started:
+            raise self.SumoStatusError("this SUMO instance is not started")
+
+        try:
+            self._request(self._STOP_COMMAND)
+        finally:
+            if self._channel is not None:
+                self._channel.close()
+            if self._worker_process is not None:
+                self._worker_process.join()
+
+            self._channel = None
+            self._worker_process = None
+            self._is_started = False
+
+    def _request(self, command: str) -> object:
+        """Send one command to the worker and wait for its reply.
+
+        :param command: Command to execute in the worker.
+
+        :raises SumoStatusError: This instance has no worker channel.
+        :raises SumoWorkerError: The worker reported an error or went away.
+
+        :returns: The result the worker sent back.
+        """
+        channel = self._channel
+        if channel is None:
+            raise self.SumoStatusError("this SUMO instance is not started")
+
+        try:
+            channel.send(command)
+            status, result = channel.recv()
+        except (OSError, EOFError):
+            raise self.SumoWorkerError("the `libsumo` worker process closed its pipe")
+
+        if status != self._OK_STATUS:
+            raise self.SumoWorkerError(result)
+        return result
+
+    @classmethod
+    def _worker(cls, channel: multiprocessing.connection.Connection[_WorkerReply, str], config: pathlib.Path) -> None:
+        """Serve `libsumo` commands arriving over the pipe, one `(status, result)` reply per command.
+
+        Runs inside the worker process and returns when asked to stop or when the parent closes its end.
+
+        :param channel: Pipe end commands arrive on and replies are sent over.
+        :param config: Path to the `sumocfg`_ configuration file for the simulation.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        """
+        while True:
+            try:
+                command = channel.recv()
+            except EOFError:
+                return
+
+            try:
+                result: Optional[SubscriptionResults] = None
+                if command == cls._START_COMMAND:
+                    cls._libsumo.start(["", cls._CONFIGURATION_FLAG, str(config)])  # type: ignore
+                elif command == cls._STEP_COMMAND:
+                    cls._libsumo.simulation.step()  # type: ignore
+                    result = cls._libsumo.vehicle.getAllSubscriptionResults()  # type: ignore
+                elif command == cls._STOP_COMMAND:
+                    cls._libsumo.close()  # type: ignore
+                else:
+                    channel.send((cls._ERROR_STATUS, f"unknown command '{command}'"))
+                    continue
+            except cls._libsumo.TraCIException as e:  # type: ignore
+                channel.send((cls._ERROR_STATUS, str(e)))  # type: ignore
+            else:
+                channel.send((cls._OK_STATUS, result))
+
+            if command == cls._STOP_COMMAND:
+                return
@@ -1,13 +1,42 @@
 """SUMO instance management utilities and providers."""
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import os
 import pathlib
 import shutil
-from typing import Callable, ClassVar, Dict, Final, Optional, TypeVar
+import socket
+import sys
+from typing import ClassVar, Deque, Dict, Final, Iterable, List, Literal, Optional, Set, Tuple, TypeVar
 
-from muve.sumo_server.sumo.instances import LocalLibSumoInstance, LocalTcpSumoInstance, SumoInstance
+from muve.sumo_server.sumo.instances import (
+    LocalLibSumoInstance,
+    LocalTcpSumoInstance,
+    MultiprocessLibSumoInstance,
+    SumoInstance,
+)
 
 SumoInstanceType = TypeVar("SumoInstanceType", bound=SumoInstance)
 
 
+@functools.lru_cache(maxsize=None)  # type: ignore
+def _resolve_executable(command_name: str) -> Optional[pathlib.Path]:
+    """Resolve a command name to an executable path, caching the result.
+
+    :func:`shutil.which` walks (and stats every candidate on) `$PATH`; since the resolution is stable for the
+    lifetime of the server, it is only worth paying once per command name.
+
+    :param command_name: Name of the command to resolve.
+
+    :returns: Path to the resolved executable, or `None` if the command could not be found.
+    """
+    command = shutil.which(command_name)
+    if command is None:
+        return None
+    return pathlib.Path(command)
+
+
 class SumoInstanceManager:
     """Manages a collection of (local) SUMO instances.
 
@@ -23,10 +52,74 @@ class SumoInstanceManager:
 
     _DEFAULT_SUMO_COMMAND_NAME: Final[str] = "sumo"
     _DEFAULT_INSTANCE_NAME: Final[str] = "default"
-    _STARTING_PORT_NUMBER: Final[int] = 8800
+    _PREFER_LIBSUMO_ENV_VAR: Final[str] = "SUMO_PREFER_LIBSUMO"
+    _WARM_POOL_WORKERS: Final[int] = 2
+    _LOCAL_HOST_NAME: Final[str] = "127.0.0.1"
 
     _instances: ClassVar[Dict[str, SumoInstance]] = {}
-    _current_port_number: ClassVar[int] = _STARTING_PORT_NUMBER
+    #: Paths already validated by a successful instance creation; instances skip re-stat-ing these.
+    _validated_paths: ClassVar[Set[pathlib.Path]] = set()
+    _warm_pool: ClassVar[Deque[LocalTcpSumoInstance]] = collections.deque()
+    _warm_config: ClassVar[Optional[pathlib.Path]] = None
+    _warm_executor: ClassVar[Optional[concurrent.futures.ThreadPoolExecutor]] = None
+
+    @classmethod
+    def warm(cls, count: int = 1, *, config: pathlib.Path) -> None:
+        """Pre-spawn SUMO processes in the background for later adoption.
+
+        Spawning SUMO and establishing its TCP connection dominates instance creation latency. Warming the manager
+        ahead of time hides this cost: subsequent calls to :meth:`~.create_local_tcp_instance` with the same
+        configuration (and no explicit executable or port) adopt an already-running process instead of spawning one.
+
+        :param count: Number of SUMO processes to pre-spawn.
+        :param config: Path to the `sumocfg`_ configuration file the pre-spawned processes should use.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        """
+        cls._warm_config = config
+        for _ in range(count):
+            cls._submit_warm_instance(config)
+
+    @classmethod
+    def create_local_instance(
+        cls,
+        name: str = _DEFAULT_INSTANCE_NAME,
+        *,
+        config: pathlib.Path,
+        transport: Literal["auto", "tcp", "lib"] = "auto",
+    ) -> SumoInstance:
+        """Create a local SUMO instance using the most efficient interface currently available.
+
+        With the `"lib"` transport (or `"auto"` while the environment variable named by
+        :attr:`~._PREFER_LIBSUMO_ENV_VAR` is set), the instance is backed by `libsumo`_, which skips both the
+        subprocess spawn and the per-command TCP round-trips: in-process through
+        :class:`~muve.sumo_server.sumo.instances.LocalLibSumoInstance` while the one-per-process `libsumo`_ slot is
+        free, and through a :class:`~muve.sumo_server.sumo.instances.MultiprocessLibSumoInstance` worker once it is
+        taken. Otherwise a :class:`~muve.sumo_server.sumo.instances.LocalTcpSumoInstance` is created.
+
+        :param name: Unique name to give the SUMO instance.
+        :param config: Path to the `sumocfg`_ configuration file.
+        :param transport: Which interface to back the instance with: `"tcp"` forces a subprocess with a TCP
+            connection, `"lib"` forces `libsumo`_, and `"auto"` picks based on the environment variable above.
+
+        :raises ValueError: A SUMO instance with the supplied name already exists, or the transport is unknown.
+
+        :return: The generated (local) SUMO instance.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        .. _`libsumo`: https://sumo.dlr.de/docs/Libsumo.html
+        """
+        if transport == "tcp":
+            return cls.create_local_tcp_instance(name, config=config)
+        if transport not in ("auto", "lib"):
+            raise ValueError(f"unknown SUMO transport '{transport}'")
+
+        if transport == "lib" or os.getenv(cls._PREFER_LIBSUMO_ENV_VAR):
+            if not LocalLibSumoInstance._exists_started():
+                return cls.create_local_lib_instance(name, config=config)
+            return cls.create_local_multiprocess_lib_instance(name, config=config)
+
+        return cls.create_local_tcp_instance(name, config=config)
 
     @classmethod
     def create_local_tcp_instance(
@@ -57,26 +150,148 @@ class SumoInstanceManager:
         .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
         .. _`sumo`: https://sumo.dlr.de/docs/sumo.html
         """
+        name = sys.intern(name)
+
+        if not executable and not port:
+            warm_instance = cls._pop_warm_instance(config)
+            if warm_instance is not None:
+                return cls._adopt_warm_instance(name, warm_instance)
+
         if not executable:
             executable = cls._find_default_executable()
         if not port:
-            port = cls._choose_port()
+            port = cls._reserve_port()
+
+        # Check the name before constructing so a collision does not pay for (or leak) a built instance.
+        if name in cls._instances:
+            raise ValueError(f"SUMO instance '{name}' already exists")
+
+        skip_validation = config in cls._validated_paths and executable in cls._validated_paths
+
+        instance = cls._register_instance(
+            name,
+            LocalTcpSumoInstance(config=config, executable=executable, port=port, skip_validation=skip_validation),
+        )
+
+        cls._validated_paths.add(config)
+        cls._validated_paths.add(executable)
+        return instance
+
+    @classmethod
+    def create_local_tcp_instances(
+        cls,
+        names: Iterable[str],
+        *,
+        config: pathlib.Path,
+        executable: Optional[pathlib.Path] = None,
+    ) -> List[LocalTcpSumoInstance]:
+        """Create and start several local TCP SUMO instances in one call.
+
+        Creating instances one at a time pays the SUMO boot latency once per instance. This batch variant amortizes
+        the fixed costs instead: the executable is resolved once, every process is spawned before any connection is
+        attempted (so the SUMO boots overlap), and the connections are then established concurrently.
+
+        :param names: Unique names to give the SUMO instances, one instance is created per name.
+        :param config: Path to the `sumocfg`_ configuration file shared by the instances.
+        :param executable: Path to the base `sumo`_ executable,
+            if not supplied then an attempt to find the default SUMO executable is made.
+
+        :raises ValueError: A SUMO instance with one of the supplied names already exists.
+
+        :return: The generated and started (local) SUMO instances, in the order of the supplied names.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        .. _`sumo`: https://sumo.dlr.de/docs/sumo.html
+        """
+        instances = [
+            cls.create_local_tcp_instance(name, config=config, executable=executable)
+            for name in names
+        ]
+        if not instances:
+            return instances
+
+        for instance in instances:
+            if not instance._process:
+                instance._spawn()
 
-        # Get around some funky mypy typing issues by aliasing the non-None variables and using them in the lambda.
-        # mypy gets confused because it thinks that the variables can change to None, since they are optional, down
-        # the line before the function is called, but we know that is not the case and we enforce it here.
-        _executable = executable
-        _port = port
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(instances)) as executor:
+            futures = [executor.submit(instance.start) for instance in instances]
+            for future in futures:
+                future.result()
 
-        def instance_factory(executable: pathlib.Path = _executable, port: int = _port) -> LocalTcpSumoInstance:
-            # mypy struggles with understanding that exe
-            return LocalTcpSumoInstance(config=config, executable=executable, port=port)
+        return instances
 
+    @classmethod
+    async def create_local_tcp_instances_async(
+        cls,
+        names: Iterable[str],
+        *,
+        config: pathlib.Path,
+        executable: Optional[pathlib.Path] = None,
+    ) -> List[LocalTcpSumoInstance]:
+        """Create and start several local TCP SUMO instances without blocking the running event loop.
+
+        Behaves like :meth:`~.create_local_tcp_instances`, but drives the connections through
+        :func:`asyncio.gather` instead of a thread pool.
+
+        :param names: Unique names to give the SUMO instances, one instance is created per name.
+        :param config: Path to the `sumocfg`_ configuration file shared by the instances.
+        :param executable: Path to the base `sumo`_ executable,
+            if not supplied then an attempt to find the default SUMO executable is made.
+
+        :raises ValueError: A SUMO instance with one of the supplied names already exists.
+
+        :return: The generated and started (local) SUMO instances, in the order of the supplied names.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        .. _`sumo`: https://sumo.dlr.de/docs/sumo.html
+        """
+        instances = [
+            cls.create_local_tcp_instance(name, config=config, executable=executable)
+            for name in names
+        ]
+
+        await asyncio.gather(*(instance.start_async() for instance in instances))
+        return instances
+
+    @classmethod
+    async def create_local_tcp_instance_async(
+        cls,
+        name: str = _DEFAULT_INSTANCE_NAME,
+        *,
+        config: pathlib.Path,
+        executable: Optional[pathlib.Path] = None,
+        port: Optional[int] = None,
+    ) -> LocalTcpSumoInstance:
+        """Create and start a local TCP SUMO instance without blocking the running event loop.
+
+        Behaves like :meth:`~.create_local_tcp_instance`, except the returned instance is already started via
+        :meth:`~muve.sumo_server.sumo.instances.LocalTcpSumoInstance.start_async`. Awaiting several of these calls
+        through :func:`asyncio.gather` boots the SUMO processes concurrently, amortizing the spawn cost across
+        instances.
+
+        :param name: Unique name to give the SUMO instance.
+        :param config: Path to the `sumocfg`_ configuration file.
+        :param executable: Path to the base `sumo`_ executable,
+            if not supplied then an attempt to find the default SUMO executable is made.
+        :param port: Port number to start and connect to the SUMO instance on,
+            if not supplied then we choose a port that has not been seen before by this manager.
+
+        :raises ValueError: A SUMO instance with the supplied name already exists.
+
+        :return: The generated and started (local) SUMO instance.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        .. _`sumo`: https://sumo.dlr.de/docs/sumo.html
+        """
         try:
-            return cls._create_instance(name, instance_factory)
+            instance = cls.create_local_tcp_instance(name, config=config, executable=executable, port=port)
         except ValueError:
             raise
 
+        await instance.start_async()
+        return instance
+
     @classmethod
     def create_local_lib_instance(
         cls,
@@ -101,14 +316,55 @@ class SumoInstanceManager:
         .. _`sumo`: https://sumo.dlr.de/docs/sumo.html
         .. _`libsumo`: https://sumo.dlr.de/docs/Libsumo.html
         """
+        name = sys.intern(name)
+        if name in cls._instances:
+            raise ValueError(f"SUMO instance '{name}' already exists")
 
-        def instance_factory() -> LocalLibSumoInstance:
-            return LocalLibSumoInstance(config=config)
+        skip_validation = config in cls._validated_paths
+        instance = cls._register_instance(
+            name,
+            LocalLibSumoInstance(config=config, skip_validation=skip_validation),
+        )
 
-        try:
-            return cls._create_instance(name, instance_factory)
-        except ValueError:
-            raise
+        cls._validated_paths.add(config)
+        return instance
+
+    @classmethod
+    def create_local_multiprocess_lib_instance(
+        cls,
+        name: str = _DEFAULT_INSTANCE_NAME,
+        *,
+        config: pathlib.Path,
+    ) -> MultiprocessLibSumoInstance:
+        """Create a local SUMO instance backed by `libsumo`_ running in a dedicated worker process.
+
+        The :class:`~muve.sumo_server.sumo.instances.MultiprocessLibSumoInstance` class is used for the instance,
+        lifting the one-simulation-per-process limit of plain `libsumo`_ at the cost of piping commands to a worker.
+
+        The created SUMO instance is returned, but can be acquired subsequently using :meth:`~.get_instance`.
+
+        :param name: Unique name to give the SUMO instance.
+        :param config: Path to the `sumocfg`_ configuration file.
+
+        :raises ValueError: A SUMO instance with the supplied name already exists.
+
+        :return: The generated (local) SUMO instance.
+
+        .. _`sumocfg`: https://sumo.dlr.de/docs/Tutorials/Hello_SUMO.html
+        .. _`libsumo`: https://sumo.dlr.de/docs/Libsumo.html
+        """
+        name = sys.intern(name)
+        if name in cls._instances:
+            raise ValueError(f"SUMO instance '{name}' already exists")
+
+        skip_validation = config in cls._validated_paths
+        instance = cls._register_instance(
+            name,
+            MultiprocessLibSumoInstance(config=config, skip_validation=skip_validation),
+        )
+
+        cls._validated_paths.add(config)
+        return instance
 
     @classmethod
     def get_instance(cls, name: str = _DEFAULT_INSTANCE_NAME) -> SumoInstance:
@@ -122,10 +378,10 @@ class SumoInstanceManager:
 
         :return: The SUMO instance associated with the supplied name exists.
         """
-        try:
-            return cls._instances[name]
-        except KeyError:
+        instance = cls._instances.get(sys.intern(name))
+        if instance is None:
             raise ValueError(f"SUMO instance '{name}' has not been created")
+        return instance
 
     @classmethod
     def destroy_instance(cls, name: str = _DEFAULT_INSTANCE_NAME) -> None:
@@ -139,32 +395,83 @@ class SumoInstanceManager:
         :raises ValueError: No managed SUMO instance with the supplied name exists.
         """
         try:
-            instance = cls._instances.pop(name)
+            instance = cls._instances.pop(sys.intern(name))
         except KeyError:
             raise ValueError(f"SUMO instance '{name}' does not exist")
 
+        instance._release()
         instance.stop()
 
     @classmethod
-    def _create_instance(cls, name: str, instance_factory: Callable[[], SumoInstanceType]) -> SumoInstanceType:
+    def _register_instance(cls, name: str, instance: SumoInstanceType) -> SumoInstanceType:
         if name in cls._instances:
             raise ValueError(f"SUMO instance '{name}' already exists")
 
-        instance = instance_factory()
         cls._instances[name] = instance
         return instance
 
+    @classmethod
+    def _adopt_warm_instance(cls, name: str, warm_instance: LocalTcpSumoInstance) -> LocalTcpSumoInstance:
+        try:
+            instance = cls._register_instance(name, warm_instance)
+        except ValueError:
+            # The name was already taken; put the warm instance back so it is not leaked.
+            cls._warm_pool.appendleft(warm_instance)
+            raise
+
+        # Refill the pool in the background so the next creation can also skip the spawn.
+        cls._submit_warm_instance(warm_instance.config)
+        return instance
+
+    @classmethod
+    def _pop_warm_instance(cls, config: pathlib.Path) -> Optional[LocalTcpSumoInstance]:
+        if config != cls._warm_config:
+            return None
+
+        try:
+            return cls._warm_pool.popleft()
+        except IndexError:
+            return None
+
+    @classmethod
+    def _submit_warm_instance(cls, config: pathlib.Path) -> None:
+        instance = LocalTcpSumoInstance(
+            config=config,
+            executable=cls._find_default_executable(),
+            port=cls._reserve_port(),
+        )
+
+        def prepare(instance: LocalTcpSumoInstance = instance) -> None:
+            instance._spawn()
+            instance._connect()
+            cls._warm_pool.append(instance)
+
+        cls._warm_pool_executor().submit(prepare)
+
+    @classmethod
+    def _warm_pool_executor(cls) -> concurrent.futures.ThreadPoolExecutor:
+        if cls._warm_executor is None:
+            cls._warm_executor = concurrent.futures.ThreadPoolExecutor(max_workers=cls._WARM_POOL_WORKERS)
+        return cls._warm_executor
+
     @classmethod
     def _find_default_executable(cls) -> pathlib.Path:
-        if command := shutil.which(cls._DEFAULT_SUMO_COMMAND_NAME):
-            return pathlib.Path(command)
+        if executable := _resolve_executable(cls._DEFAULT_SUMO_COMMAND_NAME):
+            return executable
 
         raise cls.SumoExecutableNotFound(
             "could not find default SUMO executable path, ensure that the `sumo` command can be run from the shell",
         )
 
     @classmethod
-    def _choose_port(cls) -> int:
-        port = cls._current_port_number
-        cls._current_port_number += 1
-        return port
+    def _reserve_port(cls) -> int:
+        # Bind to port 0 so the OS hands out a port it knows to be free, instead of counting upwards and hoping no
+        # other service holds the number. SO_REUSEPORT (where available) lets SUMO rebind the port right away.
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as reservation:
+            reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            reservation.bind((cls._LOCAL_HOST_NAME, 0))
+            # typeshed types getsockname as Any; for an AF_INET socket it is a (host, port) pair.
+            sockaddr: Tuple[str, int] = reservation.getsockname()
+        return sockaddr[1]
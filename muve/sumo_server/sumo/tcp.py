@@ -1,7 +1,17 @@
 """Utilities and helpers for connecting and interacting with a SUMO instance over TCP."""
+import asyncio
+import collections
+import io
 import ipaddress
+import pathlib
 import socket
-from typing import Tuple
+import struct
+import threading
+from typing import ClassVar, Deque, Dict, Final, List, Optional, Sequence, Tuple, Union
+
+#: Host addresses accepted by connections: a plain string is used as-is, saving the parse-and-validate round-trip of
+#: the :mod:`ipaddress` classes for callers (e.g. configuration files) that already hold one.
+HostAddress = Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address]
 
 
 class SumoTcpConnection:
@@ -10,22 +20,183 @@ class SumoTcpConnection:
     class SumoSocketError(Exception):
         """Raised when something goes wrong with the SUMO socket."""
 
-    _address: Tuple[ipaddress.IPv4Address, int]
-    _socket: socket.socket
+    #: Default send and receive buffer size. Subscription responses per step can be tens of kilobytes; sizing the
+    #: buffers well above the kernel default cuts syscalls per step and lets window scaling negotiate a larger window.
+    DEFAULT_BUFFER_SIZE: Final[int] = 1 << 20
+
+    #: Messages are length-prefixed with this header so one header read sizes the body read exactly.
+    _MESSAGE_HEADER: Final[struct.Struct] = struct.Struct(">I")
+
+    #: Starting size of the persistent receive buffer; it grows only when a message exceeds the current capacity,
+    #: so typical messages never allocate on receive.
+    _INITIAL_RECEIVE_BUFFER_SIZE: Final[int] = 1 << 16
+
+    #: Keepalive probing schedule: probe after this many seconds of idleness, then every interval, giving up (and
+    #: erroring pending socket calls) after the probe count. Bounds dead-peer detection to roughly ten seconds
+    #: instead of the kernel's multi-minute retransmit schedule.
+    _KEEPALIVE_IDLE_SECONDS: Final[int] = 5
+    _KEEPALIVE_INTERVAL_SECONDS: Final[int] = 2
+    _KEEPALIVE_PROBE_COUNT: Final[int] = 3
+
+    #: Upper bound on how long transmitted data may stay unacknowledged before the connection is declared dead.
+    _USER_TIMEOUT_MILLISECONDS: Final[int] = 15000
 
-    def __init__(self, host: ipaddress.IPv4Address, port: int) -> None:
+    #: Buffer size of the file views returned by :attr:`~.reader` and :attr:`~.writer`.
+    _FILE_BUFFER_SIZE: Final[int] = 1 << 16
+
+    #: Established connections released for reuse, keyed by address. Values are held strongly: a pooled connection
+    #: has no other owner by definition, and weak values would let the garbage collector close it under us.
+    _pool: ClassVar[Dict[Tuple[str, int], "SumoTcpConnection"]] = {}
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    _address: Tuple[HostAddress, int]
+    _host_str: str
+    _unix_path: Optional[pathlib.Path]
+    _family: socket.AddressFamily
+    _sockaddr: Union[str, Tuple[str, int], Tuple[str, int, int, int]]
+    _buffer_size: int
+    _socket: Optional[socket.socket]
+    _reader: Optional[io.BufferedReader]
+    _writer: Optional[io.BufferedWriter]
+    _header_buffer: bytearray
+    _receive_buffer: bytearray
+
+    def __init__(
+        self,
+        host: HostAddress,
+        port: int,
+        *,
+        unix_path: Optional[pathlib.Path] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
         """Initialize a connection over TCP to a SUMO process.
 
         Does not establish the connection (i.e. connect) until :meth:`~.connect` is called.
 
         :param host: IP address at which the connection should be established.
         :param port: Port number the SUMO process is listening to.
+        :param unix_path: Path to a Unix-domain stream socket the SUMO process listens on. When supplied, connecting
+            goes over the Unix socket instead of TCP, skipping the whole TCP/IP stack (checksums, loopback routing)
+            for local deployments.
+        :param buffer_size: Requested socket send and receive buffer size in bytes; the kernel may clamp it.
         """
         self._address = (host, port)
-        self._socket = socket.socket()
+        # Formatting the address once here keeps repeated connects (e.g. through the pool) from re-stringifying it.
+        self._host_str = host if isinstance(host, str) else str(host)
+        self._unix_path = unix_path
+        # Precompute the address family and the exact sockaddr handed to connect: choosing the family up front picks
+        # the right socket for IPv6 hosts, and the full (numeric) sockaddr means repeated (re)connects hand the
+        # kernel a ready-made address instead of re-deriving one per call.
+        if unix_path is not None:
+            self._family = socket.AF_UNIX
+            self._sockaddr = str(unix_path)
+        elif isinstance(host, ipaddress.IPv6Address) or ":" in self._host_str:
+            self._family = socket.AF_INET6
+            self._sockaddr = (self._host_str, port, 0, 0)
+        else:
+            self._family = socket.AF_INET
+            self._sockaddr = (self._host_str, port)
+        self._buffer_size = buffer_size
+        # The socket (and its file descriptor) is created lazily on connect, so connections that are constructed but
+        # never established (e.g. speculative pool slots) cost no kernel resources.
+        self._socket = None
+        self._reader = None
+        self._writer = None
+        self._header_buffer = bytearray(self._MESSAGE_HEADER.size)
+        self._receive_buffer = bytearray(self._INITIAL_RECEIVE_BUFFER_SIZE)
+
+    def _create_socket(self) -> socket.socket:
+        """Create and configure the socket this connection will be established over.
+
+        :returns: An unconnected stream socket with this connection's options applied.
+        """
+        if self._family == socket.AF_UNIX:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._buffer_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._buffer_size)
+            return sock
+
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        # Allow the local address to be rebound immediately after teardown instead of waiting out TIME_WAIT.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Disable Nagle's algorithm: TraCI traffic is many small request/response commands, and coalescing them
+        # behind delayed ACKs stalls every step by up to tens of milliseconds.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Size the buffers before connecting so window scaling is negotiated against the enlarged window.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._buffer_size)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._buffer_size)
+        # Detect a crashed SUMO process in seconds rather than letting blocked socket calls hang for the kernel's
+        # multi-minute retransmit schedule; without this, dead connections pile threads and tasks up. The options are
+        # Linux-specific, so fall back silently where they do not exist.
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self._KEEPALIVE_IDLE_SECONDS)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self._KEEPALIVE_INTERVAL_SECONDS)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self._KEEPALIVE_PROBE_COUNT)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, self._USER_TIMEOUT_MILLISECONDS)
+        except AttributeError:  # pragma: nocover
+            pass
+        return sock
+
+    @classmethod
+    def from_socket(cls, sock: socket.socket) -> "SumoTcpConnection":
+        """Wrap an already-connected stream socket (e.g. one end of a :func:`socket.socketpair`) in a connection.
+
+        Lets same-host integrations and tests inject a duplex byte stream that skips the network stack entirely
+        while reusing the connection's framing helpers.
+
+        :param sock: Connected stream socket to adopt.
+
+        :returns: A connection that uses the supplied socket; calling :meth:`~.connect` on it is unnecessary.
+        """
+        connection = cls("", 0)
+        connection._socket = sock
+        return connection
+
+    @classmethod
+    def acquire(cls, host: HostAddress, port: int) -> "SumoTcpConnection":
+        """Get an established connection to the given address, reusing a pooled one when available.
+
+        Connections returned to the pool via :meth:`~.release` keep their socket open, so reacquiring one skips the
+        TCP handshake (and the TIME_WAIT churn of closing) entirely.
+
+        :param host: IP address at which the connection should be established.
+        :param port: Port number the SUMO process is listening to.
+
+        :raises SumoSocketError: A new connection had to be established and connecting it failed.
+
+        :returns: An established connection to the address.
+        """
+        connection = cls._pop_pooled(host, port)
+        if connection is not None:
+            return connection
+
+        connection = cls(host, port)
+        connection.connect()
+        return connection
+
+    def release(self) -> None:
+        """Return this connection to the shared pool instead of closing it.
+
+        The next :meth:`~.acquire` for the same address adopts the connection, socket and all.
+        """
+        with self._pool_lock:
+            self._pool[(str(self._address[0]), self._address[1])] = self
+
+    @classmethod
+    def _pop_pooled(cls, host: HostAddress, port: int) -> Optional["SumoTcpConnection"]:
+        """Pop a pooled connection to the given address, if one exists.
+
+        :param host: IP address of the pooled connection.
+        :param port: Port number of the pooled connection.
+
+        :returns: A previously released connection to the address, or `None`.
+        """
+        with cls._pool_lock:
+            return cls._pool.pop((str(host), port), None)
 
     @property
-    def address(self) -> Tuple[ipaddress.IPv4Address, int]:
+    def address(self) -> Tuple[HostAddress, int]:
         """Get the address this SUMO connection is with.
 
         :returns: SUMO executable host and port as a tuple in that order.
@@ -34,23 +205,350 @@ class SumoTcpConnection:
 
     @property
     def socket(self) -> socket.socket:
-        """Get the initialized socket that connects the SUMO process.
+        """Get the socket that connects the SUMO process.
+
+        The socket is created lazily when the connection is established, and is not guaranteed to still be open,
+        only to exist.
 
-        The returned socket is not guaranteed to be open, only that it exists.
+        :raises SumoSocketError: The connection has not been established, so no socket exists yet.
 
-        :return: The initialized TCP socket with the SUMO process.
+        :return: The socket with the SUMO process.
         """
+        if self._socket is None:
+            raise self.SumoSocketError("the SUMO socket does not exist until the connection is established")
         return self._socket
 
-    def connect(self) -> None:
+    @property
+    def reader(self) -> io.BufferedReader:
+        """Get a buffered binary reader over the socket.
+
+        Callers that parse responses field by field should read through this instead of the raw socket: the buffer
+        turns many small reads into one ``recv`` syscall each time it refills. Do not mix buffered and raw reads on
+        the same connection, as bytes held in the buffer are invisible to :meth:`socket.socket.recv`.
+
+        :raises SumoSocketError: The connection has not been established, so no socket exists yet.
+
+        :returns: A buffered reader over the socket, created on first access and reused after.
+        """
+        if self._reader is None:
+            self._reader = io.BufferedReader(socket.SocketIO(self.socket, "rb"), self._FILE_BUFFER_SIZE)
+        return self._reader
+
+    @property
+    def writer(self) -> io.BufferedWriter:
+        """Get a buffered binary writer over the socket.
+
+        Small writes accumulate in the buffer and reach the kernel in one ``send`` syscall on flush, like
+        :meth:`~.send_batch` but for callers that build their output incrementally. Flush before expecting a
+        response, and do not mix buffered and raw writes on the same connection.
+
+        :raises SumoSocketError: The connection has not been established, so no socket exists yet.
+
+        :returns: A buffered writer over the socket, created on first access and reused after.
+        """
+        if self._writer is None:
+            self._writer = io.BufferedWriter(socket.SocketIO(self.socket, "wb"), self._FILE_BUFFER_SIZE)
+        return self._writer
+
+    #: Default bound on how long :meth:`~.connect` may block. Without one, a connect racing SUMO's listener
+    #: bring-up blocks until the kernel's SYN retransmit timeout, which can run to minutes.
+    DEFAULT_CONNECT_TIMEOUT_SECONDS: Final[float] = 5.0
+
+    def connect(self, timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS) -> None:
         """Establish a TCP connection to the SUMO process by connecting a socket.
 
+        :param timeout: Maximum time in seconds to wait for the connection to be accepted.
+
+        :raises SumoSocketError: The connection timed out, or something else went wrong when establishing the SUMO
+            socket connection. The error is more specialized, check out the `socket.socket.connect documentation`_
+            for more details.
+
+        .. _`socket.socket.connect documentation`: https://docs.python.org/3/library/socket.html#socket.socket.connect
+        """
+        if self._socket is None:
+            self._socket = self._create_socket()
+
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(self._sockaddr)
+        except OSError as e:
+            raise self.SumoSocketError(e)
+        finally:
+            # Restore blocking mode for downstream code that expects it.
+            self._socket.settimeout(None)
+
+    async def connect_async(self) -> None:
+        """Establish a TCP connection to the SUMO process without blocking the running event loop.
+
+        Behaves like :meth:`~.connect` but cooperates with :mod:`asyncio`, so many connections can be established
+        concurrently (e.g. when booting several SUMO instances at once).
+
         :raises SumoSocketError: Something went wrong when establishing the SUMO socket connection. The error is more
             specialized, check out the `socket.socket.connect documentation`_ for more details.
 
         .. _`socket.socket.connect documentation`: https://docs.python.org/3/library/socket.html#socket.socket.connect
         """
+        if self._socket is None:
+            self._socket = self._create_socket()
+
+        loop = asyncio.get_running_loop()
+        self._socket.setblocking(False)
+        try:
+            await loop.sock_connect(self._socket, self._sockaddr)
+        except OSError as e:
+            raise self.SumoSocketError(e)
+        finally:
+            self._socket.setblocking(True)
+
+    def send_message(self, payload: bytes) -> None:
+        """Send one length-prefixed message in a single scatter-gather syscall.
+
+        The length header and the payload are handed to the kernel together via :meth:`socket.socket.sendmsg`, so a
+        message costs one syscall instead of separate header and body sends.
+
+        :param payload: Payload bytes to send.
+
+        :raises SumoSocketError: Something went wrong when sending over the SUMO socket.
+        """
+        try:
+            self._sendmsg_all([self._MESSAGE_HEADER.pack(len(payload)), payload])
+        except OSError as e:
+            raise self.SumoSocketError(e)
+
+    def send_batch(self, payloads: Sequence[bytes]) -> None:
+        """Send several payloads in a single scatter-gather syscall.
+
+        Accumulating a step's worth of commands and flushing them together means the whole batch goes out in one
+        write, instead of paying per-command syscall and ACK-delay costs.
+
+        :param payloads: Payload byte strings to send back to back.
+
+        :raises SumoSocketError: Something went wrong when sending over the SUMO socket.
+        """
+        if not payloads:
+            return
+
         try:
-            self._socket.connect((str(self.address[0]), self.address[1]))
+            self._sendmsg_all(list(payloads))
         except OSError as e:
             raise self.SumoSocketError(e)
+
+    def _sendmsg_all(self, buffers: Sequence[Union[bytes, memoryview]]) -> None:
+        """Send the supplied buffers in full, starting with a single scatter-gather syscall.
+
+        Like ``send``, :meth:`socket.socket.sendmsg` may write only part of the gathered bytes even on a blocking
+        socket; anything short would corrupt the length-prefixed stream, so on the rare partial write the unsent
+        tail is flattened and pushed out with :meth:`socket.socket.sendall`.
+
+        :param buffers: Buffers to send back to back.
+        """
+        sock = self.socket
+        sent = sock.sendmsg(buffers)
+        if sent >= sum(len(buffer) for buffer in buffers):
+            return
+
+        sock.sendall(memoryview(b"".join(buffers))[sent:])
+
+    def recv_message(self) -> bytes:
+        """Receive one length-prefixed message, as sent by :meth:`~.send_message`.
+
+        The header and body are read with :meth:`socket.socket.recv_into` into persistent buffers owned by this
+        connection, so steady-state receiving performs no per-message allocation beyond the returned copy.
+
+        :raises SumoSocketError: The connection was closed before a whole message arrived.
+
+        :returns: The received payload bytes.
+        """
+        self._recv_exact_into(memoryview(self._header_buffer))
+        length: int
+        (length,) = self._MESSAGE_HEADER.unpack(self._header_buffer)  # type: ignore
+
+        if len(self._receive_buffer) < length:
+            self._receive_buffer = bytearray(length)
+
+        view = memoryview(self._receive_buffer)[:length]
+        self._recv_exact_into(view)
+        return bytes(view)
+
+    def _recv_exact_into(self, view: memoryview) -> None:
+        """Receive from the socket until the supplied view is completely filled.
+
+        :param view: Writable view to fill with received bytes.
+
+        :raises SumoSocketError: The connection was closed before the view could be filled.
+        """
+        sock = self.socket
+        while view:
+            received = sock.recv_into(view)
+            if not received:
+                raise self.SumoSocketError("SUMO connection closed mid-message")
+            view = view[received:]
+
+
+class SumoMuxConnection:
+    """Multiplexes several SUMO command streams over a single TCP connection.
+
+    Each stream gets a numeric channel; outbound payloads are framed as `(channel id, payload length, payload)` and
+    batched so one `send` syscall carries the frames of many channels, instead of one syscall and one TCP round-trip
+    per instance. Inbound frames are routed to per-channel queues.
+
+    This requires a peer that understands the framing; when it does not, fall back to one
+    :class:`~.SumoTcpConnection` per instance.
+    """
+
+    class SumoChannelError(Exception):
+        """Raised when a mux channel does not exist or is used incorrectly."""
+
+    _FRAME_HEADER: Final[struct.Struct] = struct.Struct(">II")
+    _ZERO_HEADER: Final[bytes] = bytes(_FRAME_HEADER.size)
+
+    _connection: SumoTcpConnection
+    _channels: Dict[int, Deque[bytes]]
+    _next_channel_id: int
+    _outbound: List[Tuple[int, bytes]]
+    _outbound_headers: bytearray
+
+    def __init__(self, host: HostAddress, port: int) -> None:
+        """Initialize a multiplexed connection over TCP to a SUMO process.
+
+        Does not establish the connection (i.e. connect) until :meth:`~.connect` is called.
+
+        :param host: IP address at which the connection should be established.
+        :param port: Port number the SUMO process is listening to.
+        """
+        self._connection = SumoTcpConnection(host, port)
+        self._channels = {}
+        self._next_channel_id = 0
+        self._outbound = []
+        self._outbound_headers = bytearray()
+
+    @property
+    def connection(self) -> SumoTcpConnection:
+        """Get the underlying (shared) SUMO TCP connection.
+
+        :returns: The TCP connection all channels are multiplexed over.
+        """
+        return self._connection
+
+    def connect(self) -> None:
+        """Establish the underlying TCP connection to the SUMO process.
+
+        :raises SumoTcpConnection.SumoSocketError: Something went wrong when establishing the socket connection.
+        """
+        self._connection.connect()
+
+    def open_channel(self) -> int:
+        """Open a new channel on this connection.
+
+        :returns: The identifier of the opened channel.
+        """
+        channel_id = self._next_channel_id
+        self._next_channel_id += 1
+        self._channels[channel_id] = collections.deque()
+        return channel_id
+
+    def close_channel(self, channel_id: int) -> None:
+        """Close a channel, dropping any frames still queued for it.
+
+        :param channel_id: Identifier of the channel to close.
+
+        :raises SumoChannelError: No channel with the supplied identifier exists.
+        """
+        try:
+            del self._channels[channel_id]
+        except KeyError:
+            raise self.SumoChannelError(f"channel {channel_id} does not exist")
+
+    def send(self, channel_id: int, payload: bytes) -> None:
+        """Queue a payload to be sent on a channel.
+
+        The frame is buffered until :meth:`~.flush` is called, so frames from many channels can share one syscall.
+
+        :param channel_id: Identifier of the channel to send on.
+        :param payload: Payload bytes to send.
+
+        :raises SumoChannelError: No channel with the supplied identifier exists.
+        """
+        if channel_id not in self._channels:
+            raise self.SumoChannelError(f"channel {channel_id} does not exist")
+
+        # Pack the header into a shared buffer instead of allocating a fresh bytes object per frame; flush slices the
+        # buffer back out as memoryviews, so queueing a frame costs no allocation of its own.
+        offset = len(self._outbound_headers)
+        self._outbound_headers.extend(self._ZERO_HEADER)
+        self._FRAME_HEADER.pack_into(self._outbound_headers, offset, channel_id, len(payload))
+        self._outbound.append((offset, payload))
+
+    def flush(self) -> None:
+        """Send all buffered frames in a single scatter-gather syscall.
+
+        :raises SumoTcpConnection.SumoSocketError: Something went wrong when sending over the SUMO socket.
+        """
+        if not self._outbound:
+            return
+
+        outbound, self._outbound = self._outbound, []
+        headers, self._outbound_headers = memoryview(self._outbound_headers), bytearray()
+
+        buffers: List[Union[bytes, memoryview]] = []
+        for offset, payload in outbound:
+            buffers.append(headers[offset:offset + self._FRAME_HEADER.size])
+            buffers.append(payload)
+
+        try:
+            self._connection._sendmsg_all(buffers)
+        except OSError as e:
+            raise SumoTcpConnection.SumoSocketError(e)
+
+    def receive(self, channel_id: int) -> Optional[bytes]:
+        """Get the next received payload for a channel, if one has been routed to it.
+
+        :param channel_id: Identifier of the channel to receive on.
+
+        :raises SumoChannelError: No channel with the supplied identifier exists.
+
+        :returns: The next payload routed to the channel, or `None` if the channel's queue is empty.
+        """
+        try:
+            queue = self._channels[channel_id]
+        except KeyError:
+            raise self.SumoChannelError(f"channel {channel_id} does not exist")
+
+        if not queue:
+            return None
+        return queue.popleft()
+
+    def pump(self) -> None:
+        """Read one inbound frame off the socket and route its payload to the owning channel's queue.
+
+        :raises SumoChannelError: The received frame targets a channel that does not exist.
+        """
+        header = self._recv_exact(self._FRAME_HEADER.size)
+        channel_id: int
+        payload_length: int
+        channel_id, payload_length = self._FRAME_HEADER.unpack(header)  # type: ignore
+        payload = self._recv_exact(payload_length)
+
+        try:
+            self._channels[channel_id].append(payload)
+        except KeyError:
+            raise self.SumoChannelError(f"received a frame for nonexistent channel {channel_id}")
+
+    def _recv_exact(self, count: int) -> bytes:
+        """Receive exactly the requested number of bytes from the underlying socket.
+
+        :param count: Number of bytes to receive.
+
+        :raises SumoTcpConnection.SumoSocketError: The connection was closed before enough bytes arrived.
+
+        :returns: The received bytes.
+        """
+        chunks = []
+        remaining = count
+        while remaining:
+            chunk = self._connection.socket.recv(remaining)
+            if not chunk:
+                raise SumoTcpConnection.SumoSocketError("SUMO connection closed mid-frame")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
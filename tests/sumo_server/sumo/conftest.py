@@ -0,0 +1,17 @@
+"""Shared fixtures for the SUMO server test suite."""
+from typing import Iterator
+
+import pytest
+
+from muve.sumo_server.sumo.manager import SumoInstanceManager
+
+
+@pytest.fixture(autouse=True)
+def reset_instance_manager(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Give every test a clean instance registry.
+
+    The manager keeps its registry as class-level state, so without this reset a registered name leaks into every
+    later test and the suite has to serialize on globally unique instance names.
+    """
+    monkeypatch.setattr(SumoInstanceManager, "_instances", {})
+    yield
@@ -1,19 +1,103 @@
 """Tests for :mod:`~muve.sumo_server.sumo.instances`."""
 from __future__ import annotations
 
+import asyncio
+import os
 import pathlib
-import subprocess  # noqa: S404, security
+import signal
 from typing import Final
 from unittest import mock
 
 import pytest
 
-from muve.sumo_server.sumo.instances import LocalLibSumoInstance, LocalTcpSumoInstance, SumoInstance
+from muve.sumo_server.sumo.instances import (
+    _LIBSUMO_ACTIVE,
+    LocalLibSumoInstance,
+    LocalTcpSumoInstance,
+    MultiprocessLibSumoInstance,
+    SpawnedSumoProcess,
+    SumoInstance,
+)
+from muve.sumo_server.sumo.tcp import SumoTcpConnection
+
+#: This file, used as a stand-in for configuration and executable paths. Resolved once at import so every test class
+#: shares the same path object.
+_HERE: Final[pathlib.Path] = pathlib.Path(__file__).resolve()
+
+
+class TestSpawnedSumoProcess:
+    PID: Final[int] = 4242
+
+    def init_process(self) -> SpawnedSumoProcess:
+        return SpawnedSumoProcess(self.PID)
+
+    def test_get_pid_succeeds(self) -> None:
+        process = self.init_process()
+        assert process.pid == self.PID
+
+    def test_returncode_is_none_before_exit(self) -> None:
+        process = self.init_process()
+        assert process.returncode is None
+
+    def test_poll_returns_none_when_running(self) -> None:
+        process = self.init_process()
+
+        with mock.patch("os.waitpid", return_value=(0, 0)) as mock_waitpid:
+            assert process.poll() is None
+
+        mock_waitpid.assert_called_once_with(self.PID, os.WNOHANG)
+
+    def test_poll_returns_code_when_exited(self) -> None:
+        process = self.init_process()
+
+        with mock.patch("os.waitpid", return_value=(self.PID, 0)):
+            assert process.poll() == 0
+
+        assert process.returncode == 0
+
+    def test_poll_after_exit_does_not_reap_again(self) -> None:
+        process = self.init_process()
+
+        with mock.patch("os.waitpid", return_value=(self.PID, 0)) as mock_waitpid:
+            process.poll()
+            assert process.poll() == 0
+
+        mock_waitpid.assert_called_once()
+
+    def test_wait_returns_code(self) -> None:
+        process = self.init_process()
+
+        with mock.patch("os.waitpid", return_value=(self.PID, 0)) as mock_waitpid:
+            assert process.wait() == 0
+
+        mock_waitpid.assert_called_once_with(self.PID, 0)
+
+    def test_wait_after_exit_does_not_reap_again(self) -> None:
+        process = self.init_process()
+
+        with mock.patch("os.waitpid", return_value=(self.PID, 0)) as mock_waitpid:
+            process.wait()
+            process.wait()
+
+        mock_waitpid.assert_called_once()
+
+    def test_terminate_signals_process(self) -> None:
+        process = self.init_process()
+
+        with mock.patch("os.kill") as mock_kill:
+            process.terminate()
+
+        mock_kill.assert_called_once_with(self.PID, signal.SIGTERM)
 
 
 class TestSumoInstance:
     NONEXISTENT_PATH: Final[pathlib.Path] = pathlib.Path("/this/path/does/not/exist")
-    FAKE_PATH: Final[pathlib.Path] = pathlib.Path(__file__).absolute()
+    FAKE_PATH: Final[pathlib.Path] = _HERE
+    #: A path that exists but is not a regular file, for exercising the validation against directories.
+    DIRECTORY_PATH: Final[pathlib.Path] = _HERE.parent
+    # Cached string form: pathlib builds the string on every `str(...)` call, and the assertions below compare
+    # against it often enough for the repetition to show up in test profiles.
+    FAKE_PATH_STR: Final[str] = str(FAKE_PATH)
 
     def test_nonexistent_path_is_nonexistent(self) -> None:
         assert not self.NONEXISTENT_PATH.exists()
@@ -26,7 +110,9 @@ class TestSumoInstance:
             SumoInstance(config=pathlib.Path(""))
 
 
-class TestLocalTcpSumoInstance(TestSumoInstance):
+@mock.patch("muve.sumo_server.sumo.instances.SumoTcpConnection")
+@mock.patch("os.posix_spawn")
+class TestLocalTcpSumoInstance:
     PORT_NUMBER: Final[int] = 8800
 
     def init_instance(self) -> LocalTcpSumoInstance:
@@ -35,10 +121,10 @@ class TestLocalTcpSumoInstance(TestSumoInstance):
         port = self.PORT_NUMBER
         return LocalTcpSumoInstance(config=config, executable=executable, port=port)
 
-    def test_init_succeeds(self) -> None:
+    def test_init_succeeds(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
         self.init_instance()
 
-    def test_init_fails_when_no_config(self) -> None:
+    def test_init_fails_when_no_config(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
         config = TestSumoInstance.NONEXISTENT_PATH
         executable = TestSumoInstance.FAKE_PATH
         port = self.PORT_NUMBER
@@ -46,7 +132,11 @@ class TestLocalTcpSumoInstance(TestSumoInstance):
         with pytest.raises(ValueError, match="config"):
             LocalTcpSumoInstance(config=config, executable=executable, port=port)
 
-    def test_init_fails_when_no_executable(self) -> None:
+    def test_init_fails_when_no_executable(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
         config = TestSumoInstance.FAKE_PATH
         executable = TestSumoInstance.NONEXISTENT_PATH
         port = self.PORT_NUMBER
@@ -54,104 +144,365 @@ class TestLocalTcpSumoInstance(TestSumoInstance):
         with pytest.raises(ValueError, match="executable"):
             LocalTcpSumoInstance(config=config, executable=executable, port=port)
 
-    def test_spawn_succeeds(self) -> None:
+    def test_init_fails_when_config_is_not_a_regular_file(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        config = TestSumoInstance.DIRECTORY_PATH
+        executable = TestSumoInstance.FAKE_PATH
+        port = self.PORT_NUMBER
+
+        with pytest.raises(ValueError, match="config"):
+            LocalTcpSumoInstance(config=config, executable=executable, port=port)
+
+    def test_init_succeeds_when_validation_skipped(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        config = TestSumoInstance.NONEXISTENT_PATH
+        executable = TestSumoInstance.NONEXISTENT_PATH
+        port = self.PORT_NUMBER
+
+        LocalTcpSumoInstance(config=config, executable=executable, port=port, skip_validation=True)
+
+    def test_spawn_succeeds(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
         instance = self.init_instance()
 
-        with mock.patch("subprocess.Popen") as mock_popen:
+        instance._spawn()
+
+        args = [
+            os.fsencode(TestSumoInstance.FAKE_PATH),
+            os.fsencode(LocalTcpSumoInstance._CONFIGURATION_FLAG),
+            os.fsencode(TestSumoInstance.FAKE_PATH),
+            os.fsencode(LocalTcpSumoInstance._PORT_NUMBER_FLAG),
+            os.fsencode(str(self.PORT_NUMBER)),
+            os.fsencode(LocalTcpSumoInstance._NUM_CLIENTS_FLAG),
+            os.fsencode(str(LocalTcpSumoInstance._NUM_CLIENTS)),
+        ]
+        mock_spawn.assert_called_once_with(os.fsencode(TestSumoInstance.FAKE_PATH), args, os.environ)
+
+    def test_spawn_pins_process_when_cpu_supplied(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = LocalTcpSumoInstance(
+            config=TestSumoInstance.FAKE_PATH,
+            executable=TestSumoInstance.FAKE_PATH,
+            port=self.PORT_NUMBER,
+            cpu=2,
+        )
+        mock_spawn.return_value = TestSpawnedSumoProcess.PID
+
+        with mock.patch("os.sched_setaffinity") as mock_setaffinity:
             instance._spawn()
-            args = [
-                str(TestSumoInstance.FAKE_PATH),
-                LocalTcpSumoInstance._CONFIGURATION_FLAG,
-                str(TestSumoInstance.FAKE_PATH),
-                LocalTcpSumoInstance._PORT_NUMBER_FLAG,
-                str(self.PORT_NUMBER),
-                LocalTcpSumoInstance._NUM_CLIENTS_FLAG,
-                str(LocalTcpSumoInstance._NUM_CLIENTS),
-            ]
-            mock_popen.assert_called_once_with(args)
 
-    def test_spawn_fails_when_subprocess_fails(self) -> None:
-        instance = self.init_instance()
+        mock_setaffinity.assert_called_once_with(TestSpawnedSumoProcess.PID, {2})
 
-        with mock.patch("subprocess.Popen") as mock_popen:
-            mock_popen.side_effect = subprocess.SubprocessError
+    def test_spawn_does_not_pin_process_by_default(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
 
-            with pytest.raises(LocalTcpSumoInstance.SumoProcessError):
-                instance._spawn()
+        with mock.patch("os.sched_setaffinity") as mock_setaffinity:
+            instance._spawn()
 
-            mock_popen.assert_called_once()
+        mock_setaffinity.assert_not_called()
 
-    def test_get_process_succeeds_when_spawned(self) -> None:
+    def test_spawn_fails_when_subprocess_fails(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
         instance = self.init_instance()
+        mock_spawn.side_effect = OSError
 
-        with mock.patch("subprocess.Popen"):
+        with pytest.raises(LocalTcpSumoInstance.SumoProcessError):
             instance._spawn()
 
+        mock_spawn.assert_called_once()
+
+    def test_get_executable_succeeds(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
+        instance = self.init_instance()
+
+        assert instance.executable == TestSumoInstance.FAKE_PATH
+
+    def test_get_process_succeeds_when_spawned(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+
+        instance._spawn()
+
         assert instance.process is not None
 
-    def test_get_process_fails_when_inactive(self) -> None:
+    def test_get_process_fails_when_inactive(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
         instance = self.init_instance()
 
         with pytest.raises(LocalTcpSumoInstance.SumoProcessError):
             instance.process
 
-    def test_connect_succeeds(self) -> None:
+    def test_connect_succeeds(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
         instance = self.init_instance()
+        mock_connection._pop_pooled.return_value = None
 
-        with mock.patch("muve.sumo_server.sumo.instances.SumoTcpConnection") as mock_connection:
-            instance._connect()
+        instance._connect()
 
-            mock_connection.assert_called_once_with(mock.ANY, self.PORT_NUMBER)
-            mock_connection.return_value.connect.assert_called_once()
+        mock_connection.assert_called_once_with(mock.ANY, self.PORT_NUMBER)
+        mock_connection.return_value.connect.assert_called_once()
+        assert instance.connection is mock_connection.return_value
 
-    def test_get_connection_succeeds_when_connected(self) -> None:
+    def test_connect_adopts_pooled_connection(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
         instance = self.init_instance()
+        pooled_connection = mock.MagicMock()
+        mock_connection._pop_pooled.return_value = pooled_connection
 
-        with mock.patch("muve.sumo_server.sumo.instances.SumoTcpConnection"):
-            instance._connect()
+        instance._connect()
 
-        assert instance.connection is not None
+        assert instance.connection is pooled_connection
+        mock_connection.return_value.connect.assert_not_called()
 
-    def test_get_connection_fails_when_unconnected(self) -> None:
+    def test_connect_retries_until_connected(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        mock_connection.SumoSocketError = SumoTcpConnection.SumoSocketError
+        mock_connection._pop_pooled.return_value = None
+        mock_connection.return_value.connect.side_effect = [SumoTcpConnection.SumoSocketError(""), None]
+
+        with mock.patch("time.sleep"):
+            with mock.patch.object(SpawnedSumoProcess, "poll", return_value=None):
+                instance.start()
+
+        assert mock_connection.return_value.connect.call_count == 2
+
+    def test_connect_fails_fast_when_process_dies(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        mock_connection.SumoSocketError = SumoTcpConnection.SumoSocketError
+        mock_connection._pop_pooled.return_value = None
+        mock_connection.return_value.connect.side_effect = SumoTcpConnection.SumoSocketError("")
+
+        with mock.patch.object(SpawnedSumoProcess, "poll", return_value=1):
+            with pytest.raises(LocalTcpSumoInstance.SumoProcessError, match="exited"):
+                instance.start()
+
+        mock_connection.return_value.connect.assert_called_once()
+
+    def test_connect_fails_when_retries_exhausted(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        mock_connection.SumoSocketError = SumoTcpConnection.SumoSocketError
+        mock_connection._pop_pooled.return_value = None
+        mock_connection.return_value.connect.side_effect = SumoTcpConnection.SumoSocketError("")
+
+        with mock.patch("time.sleep"):
+            with mock.patch.object(SpawnedSumoProcess, "poll", return_value=None):
+                with pytest.raises(LocalTcpSumoInstance.SumoConnectionError, match="could not connect"):
+                    instance.start()
+
+    def test_get_connection_fails_when_unconnected(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
         instance = self.init_instance()
 
         with pytest.raises(LocalTcpSumoInstance.SumoConnectionError):
             instance.connection
 
-    def test_start_unimplemented(self) -> None:
+    def test_release_returns_connection_to_pool(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
         instance = self.init_instance()
+        instance._connect()
+        connection = instance.connection
 
-        with mock.patch.object(instance, "_spawn") as mock_spawn, mock.patch.object(
-            instance,
-            "_connect",
-        ) as mock_connect:
-            instance.start()
+        instance._release()
 
-            mock_spawn.assert_called_once()
-            mock_connect.assert_called_once()
+        connection.release.assert_called_once()
+        with pytest.raises(LocalTcpSumoInstance.SumoConnectionError):
+            instance.connection
 
-    def test_start_fails_when_already_started(self) -> None:
+    def test_release_without_connection_is_noop(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
         instance = self.init_instance()
 
-        with mock.patch.object(instance, "_spawn") as mock_spawn, mock.patch.object(
-            instance,
-            "_connect",
-        ) as mock_connect:
+        instance._release()
+
+    def test_start_unimplemented(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
+        instance = self.init_instance()
+
+        instance.start()
+
+        mock_spawn.assert_called_once()
+        mock_connection._pop_pooled.assert_called_once()
+
+    def test_start_fails_when_already_started(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        instance.start()
+
+        with pytest.raises(LocalTcpSumoInstance.SumoStatusError, match="already started"):
             instance.start()
 
-            with pytest.raises(LocalTcpSumoInstance.SumoStatusError, match="already started"):
-                instance.start()
+        mock_spawn.assert_called_once()
+        mock_connection._pop_pooled.assert_called_once()
+
+    def test_start_adopts_prepared_process_and_connection(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        instance._spawn()
+        instance._connect()
 
-            mock_spawn.assert_called_once()
-            mock_connect.assert_called_once()
+        instance.start()
+
+        mock_spawn.assert_called_once()
+        mock_connection._pop_pooled.assert_called_once()
+
+    def test_start_async_succeeds(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
+        instance = self.init_instance()
+        mock_connection._pop_pooled.return_value = None
+        mock_connection.return_value.connect_async = mock.AsyncMock()
+
+        asyncio.run(instance.start_async())
+
+        mock_spawn.assert_called_once()
+        mock_connection.return_value.connect_async.assert_awaited_once()
+        assert instance.connection is not None
 
-    def test_step_unimplemented(self) -> None:
+    def test_start_async_adopts_prepared_process_and_connection(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        instance._spawn()
+        instance._connect()
+
+        asyncio.run(instance.start_async())
+
+        mock_spawn.assert_called_once()
+        mock_connection._pop_pooled.assert_called_once()
+
+    def test_start_async_adopts_pooled_connection(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        pooled_connection = mock.MagicMock()
+        mock_connection._pop_pooled.return_value = pooled_connection
+
+        asyncio.run(instance.start_async())
+
+        assert instance.connection is pooled_connection
+        mock_connection.return_value.connect_async.assert_not_called()
+
+    def test_start_async_fails_when_already_started(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        instance.start()
+
+        with pytest.raises(LocalTcpSumoInstance.SumoStatusError, match="already started"):
+            asyncio.run(instance.start_async())
+
+    def test_start_async_retries_until_connected(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        mock_connection.SumoSocketError = SumoTcpConnection.SumoSocketError
+        mock_connection._pop_pooled.return_value = None
+        mock_connection.return_value.connect_async = mock.AsyncMock(
+            side_effect=[SumoTcpConnection.SumoSocketError(""), None],
+        )
+
+        with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
+            with mock.patch.object(SpawnedSumoProcess, "poll", return_value=None):
+                asyncio.run(instance.start_async())
+
+        assert mock_connection.return_value.connect_async.await_count == 2
+
+    def test_start_async_fails_fast_when_process_dies(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        mock_connection.SumoSocketError = SumoTcpConnection.SumoSocketError
+        mock_connection._pop_pooled.return_value = None
+        mock_connection.return_value.connect_async = mock.AsyncMock(
+            side_effect=SumoTcpConnection.SumoSocketError(""),
+        )
+
+        with mock.patch.object(SpawnedSumoProcess, "poll", return_value=1):
+            with pytest.raises(LocalTcpSumoInstance.SumoProcessError, match="exited"):
+                asyncio.run(instance.start_async())
+
+        mock_connection.return_value.connect_async.assert_awaited_once()
+
+    def test_start_async_fails_when_retries_exhausted(
+        self,
+        mock_spawn: mock.MagicMock,
+        mock_connection: mock.MagicMock,
+    ) -> None:
+        instance = self.init_instance()
+        mock_connection.SumoSocketError = SumoTcpConnection.SumoSocketError
+        mock_connection._pop_pooled.return_value = None
+        mock_connection.return_value.connect_async = mock.AsyncMock(
+            side_effect=SumoTcpConnection.SumoSocketError(""),
+        )
+
+        with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
+            with mock.patch.object(SpawnedSumoProcess, "poll", return_value=None):
+                with pytest.raises(LocalTcpSumoInstance.SumoConnectionError, match="could not connect"):
+                    asyncio.run(instance.start_async())
+
+    def test_step_unimplemented(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
         instance = self.init_instance()
 
         with pytest.raises(NotImplementedError):
             instance.step()
 
-    def test_stop_unimplemented(self) -> None:
+    def test_stop_unimplemented(self, mock_spawn: mock.MagicMock, mock_connection: mock.MagicMock) -> None:
         instance = self.init_instance()
 
         with pytest.raises(NotImplementedError):
@@ -161,7 +512,7 @@ class TestLocalTcpSumoInstance(TestSumoInstance):
 @mock.patch.object(LocalLibSumoInstance, "_libsumo")
 class TestLocalLibSumoInstance:
     def init_instance(self) -> LocalLibSumoInstance:
-        LocalLibSumoInstance._exists_started = False
+        _LIBSUMO_ACTIVE.clear()
         config = TestSumoInstance.FAKE_PATH
         return LocalLibSumoInstance(config=config)
 
@@ -174,6 +525,21 @@ class TestLocalLibSumoInstance:
         with pytest.raises(ValueError, match="config"):
             LocalLibSumoInstance(config=config)
 
+    def test_init_succeeds_when_validation_skipped(self, mock_libsumo: mock.MagicMock) -> None:
+        config = TestSumoInstance.NONEXISTENT_PATH
+
+        LocalLibSumoInstance(config=config, skip_validation=True)
+
+    def test_exists_started_tracks_libsumo_activity(self, mock_libsumo: mock.MagicMock) -> None:
+        _LIBSUMO_ACTIVE.clear()
+        assert not LocalLibSumoInstance._exists_started()
+
+        _LIBSUMO_ACTIVE.set()
+        try:
+            assert LocalLibSumoInstance._exists_started()
+        finally:
+            _LIBSUMO_ACTIVE.clear()
+
     def test_start_succeeds(self, mock_libsumo: mock.MagicMock) -> None:
         instance = self.init_instance()
 
@@ -181,7 +547,7 @@ class TestLocalLibSumoInstance:
         args = [
             "",
             LocalTcpSumoInstance._CONFIGURATION_FLAG,
-            str(TestSumoInstance.FAKE_PATH),
+            TestSumoInstance.FAKE_PATH_STR,
         ]
 
         mock_libsumo.start.assert_called_once_with(args)
@@ -217,6 +583,35 @@ class TestLocalLibSumoInstance:
 
         mock_libsumo.start.assert_called_once()
 
+    def test_subscribe_succeeds(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+        instance.start()
+
+        instance.subscribe(["vehicle_0", "vehicle_1"], [64])
+
+        assert mock_libsumo.vehicle.subscribe.call_count == 2
+        mock_libsumo.vehicle.subscribe.assert_called_with("vehicle_1", [64])
+
+    def test_subscribe_fails_when_not_started(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+
+        with pytest.raises(LocalLibSumoInstance.SumoStatusError, match="not started"):
+            instance.subscribe(["vehicle_0"], [64])
+
+        mock_libsumo.vehicle.subscribe.assert_not_called()
+
+    def test_subscribe_fails_when_lib_errors(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+        instance.start()
+
+        mock_libsumo.TraCIException = Exception
+        mock_libsumo.vehicle.subscribe.side_effect = mock_libsumo.TraCIException("")
+
+        with pytest.raises(LocalLibSumoInstance.SumoLibError):
+            instance.subscribe(["vehicle_0"], [64])
+
+        mock_libsumo.vehicle.subscribe.assert_called_once()
+
     def test_step_succeeds(self, mock_libsumo: mock.MagicMock) -> None:
         instance = self.init_instance()
         instance.start()
@@ -225,6 +620,14 @@ class TestLocalLibSumoInstance:
 
         mock_libsumo.simulation.step.assert_called_once()
 
+    def test_step_returns_subscription_results(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+        instance.start()
+
+        results = instance.step()
+
+        assert results is mock_libsumo.vehicle.getAllSubscriptionResults.return_value
+
     def test_step_fails_when_not_started(self, mock_libsumo: mock.MagicMock) -> None:
         instance = self.init_instance()
 
@@ -237,7 +640,7 @@ class TestLocalLibSumoInstance:
         instance = self.init_instance()
         instance.start()
 
-        with mock.patch.object(instance, "stop") as stop_mock:
+        with mock.patch.object(LocalLibSumoInstance, "stop") as stop_mock:
             mock_libsumo.TraCIException = Exception
             mock_libsumo.simulation.step.side_effect = mock_libsumo.TraCIException("")
 
@@ -292,3 +695,170 @@ class TestLocalLibSumoInstance:
 
         with pytest.raises(LocalLibSumoInstance.SumoStatusError, match="not started"):
             instance.step()
+
+
+@mock.patch.object(MultiprocessLibSumoInstance, "_libsumo")
+class TestMultiprocessLibSumoInstance:
+    def init_instance(self) -> MultiprocessLibSumoInstance:
+        config = TestSumoInstance.FAKE_PATH
+        return MultiprocessLibSumoInstance(config=config)
+
+    def init_started_instance(self, channel: mock.MagicMock) -> MultiprocessLibSumoInstance:
+        instance = self.init_instance()
+
+        with mock.patch.object(MultiprocessLibSumoInstance, "_worker_context") as mock_context:
+            mock_context.return_value.Pipe.return_value = (channel, mock.MagicMock())
+            channel.recv.return_value = (MultiprocessLibSumoInstance._OK_STATUS, None)
+            instance.start()
+
+        return instance
+
+    def test_init_succeeds(self, mock_libsumo: mock.MagicMock) -> None:
+        self.init_instance()
+
+    def test_init_fails_when_no_config(self, mock_libsumo: mock.MagicMock) -> None:
+        with pytest.raises(ValueError, match="config"):
+            MultiprocessLibSumoInstance(config=TestSumoInstance.NONEXISTENT_PATH)
+
+    def test_start_launches_worker(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+        channel = mock.MagicMock()
+
+        with mock.patch.object(MultiprocessLibSumoInstance, "_worker_context") as mock_context:
+            mock_context.return_value.Pipe.return_value = (channel, mock.MagicMock())
+            channel.recv.return_value = (MultiprocessLibSumoInstance._OK_STATUS, None)
+            instance.start()
+
+        mock_context.return_value.Process.return_value.start.assert_called_once()
+        channel.send.assert_called_once_with(MultiprocessLibSumoInstance._START_COMMAND)
+
+    def test_worker_context_prefers_forkserver_with_preload(self, mock_libsumo: mock.MagicMock) -> None:
+        MultiprocessLibSumoInstance._context = None
+
+        with mock.patch("multiprocessing.get_context") as mock_get_context:
+            context = MultiprocessLibSumoInstance._worker_context()
+            cached_context = MultiprocessLibSumoInstance._worker_context()
+
+        mock_get_context.assert_called_once_with("forkserver")
+        context.set_forkserver_preload.assert_called_once_with(["libsumo"])
+        assert cached_context is context
+
+        MultiprocessLibSumoInstance._context = None
+
+    def test_worker_context_falls_back_when_forkserver_unavailable(self, mock_libsumo: mock.MagicMock) -> None:
+        MultiprocessLibSumoInstance._context = None
+
+        with mock.patch("multiprocessing.get_context", side_effect=[ValueError, mock.MagicMock()]) as mock_get_context:
+            MultiprocessLibSumoInstance._worker_context()
+
+        assert mock_get_context.call_args_list == [mock.call("forkserver"), mock.call()]
+
+        MultiprocessLibSumoInstance._context = None
+
+    def test_start_fails_when_already_started(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_started_instance(mock.MagicMock())
+
+        with pytest.raises(MultiprocessLibSumoInstance.SumoStatusError, match="already started"):
+            instance.start()
+
+    def test_start_fails_and_terminates_worker_when_worker_errors(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+        channel = mock.MagicMock()
+
+        with mock.patch.object(MultiprocessLibSumoInstance, "_worker_context") as mock_context:
+            mock_context.return_value.Pipe.return_value = (channel, mock.MagicMock())
+            channel.recv.return_value = (MultiprocessLibSumoInstance._ERROR_STATUS, "")
+
+            with pytest.raises(MultiprocessLibSumoInstance.SumoWorkerError):
+                instance.start()
+
+        mock_context.return_value.Process.return_value.terminate.assert_called_once()
+
+    def test_step_returns_results(self, mock_libsumo: mock.MagicMock) -> None:
+        channel = mock.MagicMock()
+        instance = self.init_started_instance(channel)
+        results = {"vehicle": {64: (0.0, 0.0)}}
+        channel.recv.return_value = (MultiprocessLibSumoInstance._OK_STATUS, results)
+
+        assert instance.step() == results
+
+    def test_step_fails_when_not_started(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+
+        with pytest.raises(MultiprocessLibSumoInstance.SumoStatusError, match="not started"):
+            instance.step()
+
+    def test_step_fails_when_worker_closes_pipe(self, mock_libsumo: mock.MagicMock) -> None:
+        channel = mock.MagicMock()
+        instance = self.init_started_instance(channel)
+        channel.recv.side_effect = EOFError
+
+        with pytest.raises(MultiprocessLibSumoInstance.SumoWorkerError, match="closed"):
+            instance.step()
+
+    def test_step_fails_when_worker_pipe_breaks_on_send(self, mock_libsumo: mock.MagicMock) -> None:
+        channel = mock.MagicMock()
+        instance = self.init_started_instance(channel)
+        channel.send.side_effect = BrokenPipeError
+
+        with pytest.raises(MultiprocessLibSumoInstance.SumoWorkerError, match="closed"):
+            instance.step()
+
+    def test_stop_fails_cleanly_when_channel_is_gone(self, mock_libsumo: mock.MagicMock) -> None:
+        instance = self.init_instance()
+        instance._is_started = True
+
+        with pytest.raises(MultiprocessLibSumoInstance.SumoStatusError, match="not started"):
+            instance.stop()
+
+        assert not instance._is_started
+
+    def test_stop_shuts_worker_down(self, mock_libsumo: mock.MagicMock) -> None:
+        channel = mock.MagicMock()
+        instance = self.init_started_instance(channel)
+
+        instance.stop()
+
+        with pytest.raises(MultiprocessLibSumoInstance.SumoStatusError, match="not started"):
+            instance.stop()
+
+    def test_worker_serves_start_step_stop(self, mock_libsumo: mock.MagicMock) -> None:
+        channel = mock.MagicMock()
+        commands = [
+            MultiprocessLibSumoInstance._START_COMMAND,
+            MultiprocessLibSumoInstance._STEP_COMMAND,
+            MultiprocessLibSumoInstance._STOP_COMMAND,
+        ]
+        channel.recv.side_effect = commands
+        results = {"vehicle": {64: (0.0, 0.0)}}
+        mock_libsumo.vehicle.getAllSubscriptionResults.return_value = results
+
+        MultiprocessLibSumoInstance._worker(channel, TestSumoInstance.FAKE_PATH)
+
+        mock_libsumo.start.assert_called_once()
+        mock_libsumo.simulation.step.assert_called_once()
+        mock_libsumo.close.assert_called_once()
+        assert channel.send.call_args_list == [
+            mock.call((MultiprocessLibSumoInstance._OK_STATUS, None)),
+            mock.call((MultiprocessLibSumoInstance._OK_STATUS, results)),
+            mock.call((MultiprocessLibSumoInstance._OK_STATUS, None)),
+        ]
+
+    def test_worker_reports_lib_errors(self, mock_libsumo: mock.MagicMock) -> None:
+        channel = mock.MagicMock()
+        channel.recv.side_effect = [MultiprocessLibSumoInstance._START_COMMAND, EOFError]
+        mock_libsumo.TraCIException = Exception
+        mock_libsumo.start.side_effect = mock_libsumo.TraCIException("bad config")
+
+        MultiprocessLibSumoInstance._worker(channel, TestSumoInstance.FAKE_PATH)
+
+        channel.send.assert_called_once_with((MultiprocessLibSumoInstance._ERROR_STATUS, "bad config"))
+
+    def test_worker_rejects_unknown_command(self, mock_libsumo: mock.MagicMock) -> None:
+        channel = mock.MagicMock()
+        channel.recv.side_effect = ["nonsense", EOFError]
+
+        MultiprocessLibSumoInstance._worker(channel, TestSumoInstance.FAKE_PATH)
+
+        status, _ = channel.send.call_args[0][0]
+        assert status == MultiprocessLibSumoInstance._ERROR_STATUS
@@ -1,34 +1,56 @@
 """Tests for :mod:`~muve.sumo_server.sumo.manager`."""
-import inspect
+import asyncio
+import os
 import pathlib
 import shutil
-from typing import Final
+import socket
+from typing import Final, Iterator
 from unittest import mock
 
 import pytest
 
 from muve.sumo_server.sumo.instances import LocalLibSumoInstance, LocalTcpSumoInstance
-from muve.sumo_server.sumo.manager import SumoInstanceManager
+from muve.sumo_server.sumo.manager import SumoInstanceManager, _resolve_executable
+
+#: This file, used as a stand-in for configuration and executable paths. Resolved once so the test classes share a
+#: single path object instead of each issuing their own ``getcwd`` call at collection time.
+_HERE: Final[pathlib.Path] = pathlib.Path(__file__).resolve()
 
 
 class TestSumoInstanceManager:
-    @mock.patch("muve.sumo_server.sumo.manager.LocalTcpSumoInstance", autospec=True)
     class TestLocalTcpInstance:
         """Tests functionality relating to local TCP SUMO instances."""
 
         EXISTING_COMMAND_NAME = "ls"
         NONEXISTING_COMMAND_NAME = "this_command_does_not_exist"
-        FAKE_PATH: Final[pathlib.Path] = pathlib.Path(__file__).absolute()
+        FAKE_PATH: Final[pathlib.Path] = _HERE
         PORT_NUMBER: Final[int] = 9800
 
+        @pytest.fixture(scope="class")
+        @classmethod
+        def mocked_instance(cls) -> Iterator[mock.MagicMock]:
+            # Patching once per class skips autospec's signature introspection of the instance class per test, which
+            # a class-level mock.patch decorator would redo for every method.
+            with mock.patch("muve.sumo_server.sumo.manager.LocalTcpSumoInstance", autospec=True) as mocked:
+                yield mocked
+
+        @pytest.fixture(autouse=True)
+        def _reset_mocked_instance(self, mocked_instance: mock.MagicMock) -> Iterator[None]:
+            mocked_instance.reset_mock()
+            yield
+
         def test_existing_command_exists(self, mocked_instance: mock.MagicMock) -> None:
             assert shutil.which(self.EXISTING_COMMAND_NAME) is not None
 
         def test_nonexisting_command_not_exists(self, mocked_instance: mock.MagicMock) -> None:
             assert shutil.which(self.NONEXISTING_COMMAND_NAME) is None
 
-        def test_create_local_tcp_instance_succeeds(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_create_local_tcp_instance_succeeds(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
             SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
 
             instance = SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
@@ -38,26 +60,50 @@ class TestSumoInstanceManager:
                 config=self.FAKE_PATH,
                 executable=mock.ANY,
                 port=mock.ANY,
+                skip_validation=mock.ANY,
             )
 
-        def test_create_local_tcp_instance_succeeds_and_correct_port(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_create_local_tcp_instance_succeeds_and_correct_port(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
             SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
 
-            instance = SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
+            with mock.patch.object(SumoInstanceManager, "_reserve_port", return_value=8822):
+                instance = SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
 
             assert isinstance(instance, LocalTcpSumoInstance)
             mocked_instance.assert_called_once_with(
                 config=self.FAKE_PATH,
                 executable=mock.ANY,
-                port=SumoInstanceManager._current_port_number - 1,
+                port=8822,
+                skip_validation=mock.ANY,
             )
 
+        def test_reserve_port_returns_free_port(self, mocked_instance: mock.MagicMock) -> None:
+            port = SumoInstanceManager._reserve_port()
+
+            assert 0 < port <= 65535
+
+        def test_reserve_port_works_without_reuseport(
+            self,
+            mocked_instance: mock.MagicMock,
+            monkeypatch: pytest.MonkeyPatch,
+        ) -> None:
+            monkeypatch.delattr(socket, "SO_REUSEPORT", raising=False)
+
+            port = SumoInstanceManager._reserve_port()
+
+            assert 0 < port <= 65535
+
         def test_create_local_tcp_instance_succeeds_with_executable_path(
             self,
             mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
         ) -> None:
-            name = inspect.stack()[0][3]
+            name = request.node.name
 
             instance = SumoInstanceManager.create_local_tcp_instance(
                 name,
@@ -70,13 +116,15 @@ class TestSumoInstanceManager:
                 config=self.FAKE_PATH,
                 executable=self.FAKE_PATH,
                 port=mock.ANY,
+                skip_validation=mock.ANY,
             )
 
         def test_create_local_tcp_instance_succeeds_with_custom_port_number(
             self,
             mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
         ) -> None:
-            name = inspect.stack()[0][3]
+            name = request.node.name
             port = self.PORT_NUMBER
             SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
 
@@ -87,13 +135,131 @@ class TestSumoInstanceManager:
                 config=self.FAKE_PATH,
                 executable=mock.ANY,
                 port=port,
+                skip_validation=mock.ANY,
             )
 
+        def test_create_local_tcp_instance_skips_validation_when_paths_known(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+            SumoInstanceManager._validated_paths.clear()
+
+            SumoInstanceManager.create_local_tcp_instance(f"{name}_first", config=self.FAKE_PATH)
+            SumoInstanceManager.create_local_tcp_instance(f"{name}_second", config=self.FAKE_PATH)
+
+            first_call, second_call = mocked_instance.call_args_list
+            assert first_call.kwargs["skip_validation"] is False
+            assert second_call.kwargs["skip_validation"] is True
+
+        def test_create_local_tcp_instance_async_succeeds_and_starts(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+
+            instance = asyncio.run(SumoInstanceManager.create_local_tcp_instance_async(name, config=self.FAKE_PATH))
+
+            assert isinstance(instance, LocalTcpSumoInstance)
+            mocked_instance.assert_called_once()
+            mocked_instance.return_value.start_async.assert_awaited_once()
+
+        def test_create_local_tcp_instance_async_fails_when_name_exists(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+
+            SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
+            with pytest.raises(ValueError, match="already exists"):
+                asyncio.run(SumoInstanceManager.create_local_tcp_instance_async(name, config=self.FAKE_PATH))
+
+            mocked_instance.return_value.start_async.assert_not_awaited()
+
+        def test_create_local_tcp_instances_succeeds_and_starts_all(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+            mocked_instance.return_value._process = None
+
+            instances = SumoInstanceManager.create_local_tcp_instances(
+                [f"{name}_first", f"{name}_second"],
+                config=self.FAKE_PATH,
+            )
+
+            assert len(instances) == 2
+            assert mocked_instance.call_count == 2
+            assert mocked_instance.return_value._spawn.call_count == 2
+            assert mocked_instance.return_value.start.call_count == 2
+
+        def test_create_local_tcp_instances_returns_empty_for_no_names(
+            self,
+            mocked_instance: mock.MagicMock,
+        ) -> None:
+            assert SumoInstanceManager.create_local_tcp_instances([], config=self.FAKE_PATH) == []
+
+            mocked_instance.assert_not_called()
+
+        def test_create_local_tcp_instances_skips_spawn_for_prepared_processes(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+            mocked_instance.return_value._process = mock.MagicMock()
+
+            SumoInstanceManager.create_local_tcp_instances([name], config=self.FAKE_PATH)
+
+            mocked_instance.return_value._spawn.assert_not_called()
+
+        def test_create_local_tcp_instances_fails_when_name_exists(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+
+            SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
+            with pytest.raises(ValueError, match="already exists"):
+                SumoInstanceManager.create_local_tcp_instances([f"{name}_other", name], config=self.FAKE_PATH)
+
+            mocked_instance.return_value.start.assert_not_called()
+
+        def test_create_local_tcp_instances_async_succeeds_and_starts_all(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+
+            instances = asyncio.run(
+                SumoInstanceManager.create_local_tcp_instances_async(
+                    [f"{name}_first", f"{name}_second"],
+                    config=self.FAKE_PATH,
+                ),
+            )
+
+            assert len(instances) == 2
+            assert mocked_instance.return_value.start_async.await_count == 2
+
         def test_create_local_tcp_instance_fails_when_nonexistent_executable(
             self,
             mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
         ) -> None:
-            name = inspect.stack()[0][3]
+            name = request.node.name
             port = self.PORT_NUMBER
             SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.NONEXISTING_COMMAND_NAME
 
@@ -106,8 +272,12 @@ class TestSumoInstanceManager:
 
             mocked_instance.assert_not_called()
 
-        def test_create_local_tcp_instance_fails_when_name_exists(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_create_local_tcp_instance_fails_when_name_exists(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
             SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
 
             SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
@@ -116,8 +286,12 @@ class TestSumoInstanceManager:
 
             mocked_instance.assert_called_once()
 
-        def test_get_instance_succeeds_with_local_tcp(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_get_instance_succeeds_with_local_tcp(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
             SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
 
             SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
@@ -125,8 +299,12 @@ class TestSumoInstanceManager:
 
             mocked_instance.assert_called_once()
 
-        def test_destroy_instance_succeeds_with_local_tcp(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_destroy_instance_succeeds_with_local_tcp(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
             SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
 
             SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
@@ -135,22 +313,272 @@ class TestSumoInstanceManager:
             mocked_instance.assert_called_once()
             mocked_instance.return_value.stop.assert_called_once()
 
+        def test_destroy_instance_releases_connection(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+
+            SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
+            SumoInstanceManager.destroy_instance(name)
+
+            mocked_instance.return_value._release.assert_called_once()
+
+    @mock.patch("muve.sumo_server.sumo.manager.MultiprocessLibSumoInstance", autospec=True)
     @mock.patch("muve.sumo_server.sumo.manager.LocalLibSumoInstance", autospec=True)
+    @mock.patch("muve.sumo_server.sumo.manager.LocalTcpSumoInstance", autospec=True)
+    class TestLocalInstance:
+        """Tests functionality relating to transport-dispatching local instance creation."""
+
+        EXISTING_COMMAND_NAME = "ls"
+        FAKE_PATH: Final[pathlib.Path] = _HERE
+
+        def test_create_local_instance_defaults_to_tcp(
+            self,
+            mocked_tcp_instance: mock.MagicMock,
+            mocked_lib_instance: mock.MagicMock,
+            mocked_multiprocess_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+
+            with mock.patch.dict("os.environ"):
+                os.environ.pop(SumoInstanceManager._PREFER_LIBSUMO_ENV_VAR, None)
+                SumoInstanceManager.create_local_instance(name, config=self.FAKE_PATH)
+
+            mocked_tcp_instance.assert_called_once()
+            mocked_lib_instance.assert_not_called()
+
+        def test_create_local_instance_prefers_libsumo_when_requested(
+            self,
+            mocked_tcp_instance: mock.MagicMock,
+            mocked_lib_instance: mock.MagicMock,
+            mocked_multiprocess_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            mocked_lib_instance._exists_started.return_value = False
+
+            with mock.patch.dict("os.environ", {SumoInstanceManager._PREFER_LIBSUMO_ENV_VAR: "1"}):
+                SumoInstanceManager.create_local_instance(name, config=self.FAKE_PATH)
+
+            mocked_lib_instance.assert_called_once()
+            mocked_tcp_instance.assert_not_called()
+
+        def test_create_local_instance_uses_worker_when_libsumo_active(
+            self,
+            mocked_tcp_instance: mock.MagicMock,
+            mocked_lib_instance: mock.MagicMock,
+            mocked_multiprocess_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            mocked_lib_instance._exists_started.return_value = True
+
+            with mock.patch.dict("os.environ", {SumoInstanceManager._PREFER_LIBSUMO_ENV_VAR: "1"}):
+                SumoInstanceManager.create_local_instance(name, config=self.FAKE_PATH)
+
+            mocked_multiprocess_instance.assert_called_once()
+            mocked_tcp_instance.assert_not_called()
+            mocked_lib_instance.assert_not_called()
+
+        def test_create_local_instance_forces_tcp_transport(
+            self,
+            mocked_tcp_instance: mock.MagicMock,
+            mocked_lib_instance: mock.MagicMock,
+            mocked_multiprocess_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+
+            with mock.patch.dict("os.environ", {SumoInstanceManager._PREFER_LIBSUMO_ENV_VAR: "1"}):
+                SumoInstanceManager.create_local_instance(name, config=self.FAKE_PATH, transport="tcp")
+
+            mocked_tcp_instance.assert_called_once()
+            mocked_lib_instance.assert_not_called()
+
+        def test_create_local_instance_forces_lib_transport(
+            self,
+            mocked_tcp_instance: mock.MagicMock,
+            mocked_lib_instance: mock.MagicMock,
+            mocked_multiprocess_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            mocked_lib_instance._exists_started.return_value = False
+
+            with mock.patch.dict("os.environ"):
+                os.environ.pop(SumoInstanceManager._PREFER_LIBSUMO_ENV_VAR, None)
+                SumoInstanceManager.create_local_instance(name, config=self.FAKE_PATH, transport="lib")
+
+            mocked_lib_instance.assert_called_once()
+            mocked_tcp_instance.assert_not_called()
+
+        def test_create_local_instance_fails_when_unknown_transport(
+            self,
+            mocked_tcp_instance: mock.MagicMock,
+            mocked_lib_instance: mock.MagicMock,
+            mocked_multiprocess_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+
+            with pytest.raises(ValueError, match="transport"):
+                SumoInstanceManager.create_local_instance(
+                    name,
+                    config=self.FAKE_PATH,
+                    transport="carrier pigeon",  # type: ignore[arg-type]
+                )
+
+        def test_create_local_multiprocess_lib_instance_fails_when_instance_exists(
+            self,
+            mocked_tcp_instance: mock.MagicMock,
+            mocked_lib_instance: mock.MagicMock,
+            mocked_multiprocess_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+
+            SumoInstanceManager.create_local_multiprocess_lib_instance(name, config=self.FAKE_PATH)
+            with pytest.raises(ValueError, match="already exists"):
+                SumoInstanceManager.create_local_multiprocess_lib_instance(name, config=self.FAKE_PATH)
+
+            mocked_multiprocess_instance.assert_called_once()
+
+    @mock.patch.object(SumoInstanceManager, "_warm_pool_executor")
+    @mock.patch("muve.sumo_server.sumo.manager.LocalTcpSumoInstance", autospec=True)
+    class TestWarmPool:
+        """Tests functionality relating to the warm SUMO instance pool."""
+
+        EXISTING_COMMAND_NAME = "ls"
+        FAKE_PATH: Final[pathlib.Path] = _HERE
+        OTHER_PATH: Final[pathlib.Path] = pathlib.Path("/some/other/configuration")
+
+        def setup_pool(self, mocked_executor: mock.MagicMock) -> None:
+            SumoInstanceManager._warm_pool.clear()
+            SumoInstanceManager._warm_config = None
+            SumoInstanceManager._DEFAULT_SUMO_COMMAND_NAME = self.EXISTING_COMMAND_NAME
+            mocked_executor.return_value.submit.side_effect = lambda prepare: prepare()
+
+        def test_warm_populates_pool(
+            self,
+            mocked_instance: mock.MagicMock,
+            mocked_executor: mock.MagicMock,
+        ) -> None:
+            self.setup_pool(mocked_executor)
+
+            SumoInstanceManager.warm(2, config=self.FAKE_PATH)
+
+            assert len(SumoInstanceManager._warm_pool) == 2
+            assert mocked_instance.return_value._spawn.call_count == 2
+            assert mocked_instance.return_value._connect.call_count == 2
+
+        def test_create_adopts_warm_instance_and_refills(
+            self,
+            mocked_instance: mock.MagicMock,
+            mocked_executor: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            self.setup_pool(mocked_executor)
+
+            SumoInstanceManager.warm(config=self.FAKE_PATH)
+            warm_instance = SumoInstanceManager._warm_pool[0]
+
+            instance = SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
+
+            assert instance is warm_instance
+            assert len(SumoInstanceManager._warm_pool) == 1
+
+        def test_create_skips_pool_when_config_differs(
+            self,
+            mocked_instance: mock.MagicMock,
+            mocked_executor: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            self.setup_pool(mocked_executor)
+
+            SumoInstanceManager.warm(config=self.FAKE_PATH)
+            warm_instance = SumoInstanceManager._warm_pool[0]
+
+            SumoInstanceManager.create_local_tcp_instance(name, config=self.OTHER_PATH)
+
+            assert mocked_instance.call_count == 2
+            assert len(SumoInstanceManager._warm_pool) == 1
+            assert SumoInstanceManager._warm_pool[0] is warm_instance
+
+        def test_create_spawns_fresh_instance_when_pool_is_drained(
+            self,
+            mocked_instance: mock.MagicMock,
+            mocked_executor: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            self.setup_pool(mocked_executor)
+            SumoInstanceManager._warm_config = self.FAKE_PATH
+
+            instance = SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
+
+            assert instance is mocked_instance.return_value
+
+        def test_create_puts_warm_instance_back_when_name_exists(
+            self,
+            mocked_instance: mock.MagicMock,
+            mocked_executor: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
+            self.setup_pool(mocked_executor)
+
+            SumoInstanceManager.create_local_tcp_instance(name, config=self.OTHER_PATH)
+            SumoInstanceManager.warm(config=self.FAKE_PATH)
+            warm_instance = SumoInstanceManager._warm_pool[0]
+
+            with pytest.raises(ValueError, match="already exists"):
+                SumoInstanceManager.create_local_tcp_instance(name, config=self.FAKE_PATH)
+
+            assert len(SumoInstanceManager._warm_pool) == 1
+            assert SumoInstanceManager._warm_pool[0] is warm_instance
+
     class TestLocalLibInstance:
         """Tests functionality relating to local `libsumo` SUMO instances."""
 
-        FAKE_PATH: Final[pathlib.Path] = pathlib.Path(__file__).absolute()
+        FAKE_PATH: Final[pathlib.Path] = _HERE
+
+        @pytest.fixture(scope="class")
+        @classmethod
+        def mocked_instance(cls) -> Iterator[mock.MagicMock]:
+            with mock.patch("muve.sumo_server.sumo.manager.LocalLibSumoInstance", autospec=True) as mocked:
+                yield mocked
 
-        def test_create_local_lib_instance_succeeds(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        @pytest.fixture(autouse=True)
+        def _reset_mocked_instance(self, mocked_instance: mock.MagicMock) -> Iterator[None]:
+            mocked_instance.reset_mock()
+            yield
+
+        def test_create_local_lib_instance_succeeds(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
 
             instance = SumoInstanceManager.create_local_lib_instance(name, config=self.FAKE_PATH)
 
             assert isinstance(instance, LocalLibSumoInstance)
-            mocked_instance.assert_called_once_with(config=self.FAKE_PATH)
+            mocked_instance.assert_called_once_with(config=self.FAKE_PATH, skip_validation=mock.ANY)
 
-        def test_create_local_lib_instance_fails_when_name_exists(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_create_local_lib_instance_fails_when_name_exists(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
 
             SumoInstanceManager.create_local_lib_instance(name, config=self.FAKE_PATH)
             with pytest.raises(ValueError, match="already exists"):
@@ -158,16 +586,24 @@ class TestSumoInstanceManager:
 
             mocked_instance.assert_called_once()
 
-        def test_get_instance_succeeds_with_local_lib(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_get_instance_succeeds_with_local_lib(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
 
             SumoInstanceManager.create_local_lib_instance(name, config=self.FAKE_PATH)
             assert isinstance(SumoInstanceManager.get_instance(name), LocalLibSumoInstance)
 
             mocked_instance.assert_called_once()
 
-        def test_destroy_instance_succeeds_with_local_lib(self, mocked_instance: mock.MagicMock) -> None:
-            name = inspect.stack()[0][3]
+        def test_destroy_instance_succeeds_with_local_lib(
+            self,
+            mocked_instance: mock.MagicMock,
+            request: pytest.FixtureRequest,
+        ) -> None:
+            name = request.node.name
 
             SumoInstanceManager.create_local_lib_instance(name, config=self.FAKE_PATH)
             SumoInstanceManager.destroy_instance(name)
@@ -175,14 +611,39 @@ class TestSumoInstanceManager:
             mocked_instance.assert_called_once()
             mocked_instance.return_value.stop.assert_called_once()
 
-    def test_get_instance_fails_when_no_instance(self) -> None:
-        name = inspect.stack()[0][3]
+    def test_resolve_executable_caches_path_walk(self) -> None:
+        _resolve_executable.cache_clear()
+
+        with mock.patch("shutil.which", return_value="/usr/bin/some_command") as mock_which:
+            first = _resolve_executable("some_command")
+            second = _resolve_executable("some_command")
+
+        mock_which.assert_called_once_with("some_command")
+        assert first == second == pathlib.Path("/usr/bin/some_command")
+
+    def test_resolve_executable_returns_none_when_nonexistent(self) -> None:
+        _resolve_executable.cache_clear()
+
+        with mock.patch("shutil.which", return_value=None):
+            assert _resolve_executable("some_command") is None
+
+    def test_warm_pool_executor_is_created_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(SumoInstanceManager, "_warm_executor", None)
+
+        executor = SumoInstanceManager._warm_pool_executor()
+        try:
+            assert SumoInstanceManager._warm_pool_executor() is executor
+        finally:
+            executor.shutdown()
+
+    def test_get_instance_fails_when_no_instance(self, request: pytest.FixtureRequest) -> None:
+        name = request.node.name
 
         with pytest.raises(ValueError, match="has not been created"):
             SumoInstanceManager.get_instance(name)
 
-    def test_destroy_instance_fails_when_nonexistent(self) -> None:
-        name = inspect.stack()[0][3]
+    def test_destroy_instance_fails_when_nonexistent(self, request: pytest.FixtureRequest) -> None:
+        name = request.node.name
 
         with pytest.raises(ValueError, match="does not exist"):
             SumoInstanceManager.destroy_instance(name)
@@ -1,25 +1,76 @@
 """Tests for :mod:`~muve.sumo_server.sumo.tcp`."""
+import asyncio
+import collections
+import io
 import ipaddress
-from typing import Final
+import pathlib
+import socket
+from typing import Final, Sequence
 from unittest import mock
 
 import pytest
 
-from muve.sumo_server.sumo.tcp import SumoTcpConnection
+from muve.sumo_server.sumo.tcp import SumoMuxConnection, SumoTcpConnection
+
+
+def full_sendmsg(buffers: Sequence[bytes]) -> int:
+    """Stand in for :meth:`socket.socket.sendmsg` by reporting every gathered byte as written."""
+    return sum(len(buffer) for buffer in buffers)
 
 
 class TestSumoTcpConnection:
     LOCAL_HOST: Final[ipaddress.IPv6Address] = ipaddress.IPv6Address("::1")
     PORT_NUMBER: Final[int] = 8800
+    UNIX_PATH: Final[pathlib.Path] = pathlib.Path("/tmp/sumo.sock")
 
     def init_local_connection(self) -> SumoTcpConnection:
         host = self.LOCAL_HOST
         port = self.PORT_NUMBER
         return SumoTcpConnection(host, port)
 
+    def init_unix_connection(self) -> SumoTcpConnection:
+        return SumoTcpConnection(self.LOCAL_HOST, self.PORT_NUMBER, unix_path=self.UNIX_PATH)
+
+    def init_connected_connection(self) -> SumoTcpConnection:
+        connection = self.init_local_connection()
+        with mock.patch("socket.socket.connect"):
+            connection.connect()
+        return connection
+
     def test_init_local_succeeds(self) -> None:
         self.init_local_connection()
 
+    def test_init_with_string_host_succeeds(self) -> None:
+        connection = SumoTcpConnection("127.0.0.1", self.PORT_NUMBER)
+
+        assert connection.address == ("127.0.0.1", self.PORT_NUMBER)
+
+        with mock.patch("socket.socket.connect") as mock_connect:
+            connection.connect()
+
+        mock_connect.assert_called_once_with(("127.0.0.1", self.PORT_NUMBER))
+
+    def test_connect_disables_nagle(self) -> None:
+        connection = self.init_connected_connection()
+
+        assert connection.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) == 1
+
+    def test_connect_enlarges_buffers(self) -> None:
+        connection = self.init_connected_connection()
+
+        # The kernel may clamp the requested size, but it should at least exceed its usual small defaults.
+        assert connection.socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 1 << 16
+        assert connection.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 1 << 16
+
+    def test_connect_enables_keepalive(self) -> None:
+        connection = self.init_connected_connection()
+
+        assert connection.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) == 1
+        assert (
+            connection.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE)
+            == SumoTcpConnection._KEEPALIVE_IDLE_SECONDS
+        )
+
     def test_local_address_consistent(self) -> None:
         connection = self.init_local_connection()
         address = connection.address
@@ -33,6 +84,68 @@ class TestSumoTcpConnection:
         with mock.patch("socket.socket.connect"):
             connection.connect()
 
+    def test_connect_reuses_existing_socket(self) -> None:
+        connection = self.init_connected_connection()
+        sock = connection.socket
+
+        with mock.patch("socket.socket.connect"):
+            connection.connect()
+
+        assert connection.socket is sock
+
+    def test_connect_async_reuses_existing_socket(self) -> None:
+        connection = self.init_connected_connection()
+        sock = connection.socket
+
+        with mock.patch("asyncio.selector_events.BaseSelectorEventLoop.sock_connect", new_callable=mock.AsyncMock):
+            asyncio.run(connection.connect_async())
+
+        assert connection.socket is sock
+
+    def test_connect_ipv6_uses_ipv6_socket(self) -> None:
+        connection = self.init_connected_connection()
+
+        assert connection.socket.family == socket.AF_INET6
+
+    def test_connect_ipv6_uses_precomputed_sockaddr(self) -> None:
+        connection = self.init_local_connection()
+
+        with mock.patch("socket.socket.connect") as mock_connect:
+            connection.connect()
+
+        mock_connect.assert_called_once_with((str(self.LOCAL_HOST), self.PORT_NUMBER, 0, 0))
+
+    def test_connect_unix_uses_unix_socket(self) -> None:
+        connection = self.init_unix_connection()
+
+        with mock.patch("socket.socket.connect"):
+            connection.connect()
+
+        assert connection.socket.family == socket.AF_UNIX
+
+    def test_connect_unix_uses_path(self) -> None:
+        connection = self.init_unix_connection()
+
+        with mock.patch("socket.socket.connect") as mock_connect:
+            connection.connect()
+
+            mock_connect.assert_called_once_with(str(self.UNIX_PATH))
+
+    def test_connect_applies_timeout(self) -> None:
+        connection = self.init_local_connection()
+
+        with mock.patch("socket.socket.connect"), mock.patch("socket.socket.settimeout") as mock_settimeout:
+            connection.connect(timeout=1.5)
+
+        assert mock_settimeout.call_args_list == [mock.call(1.5), mock.call(None)]
+
+    def test_connect_fails_when_timed_out(self) -> None:
+        connection = self.init_local_connection()
+
+        with mock.patch("socket.socket.connect", side_effect=socket.timeout):
+            with pytest.raises(SumoTcpConnection.SumoSocketError):
+                connection.connect()
+
     def test_connect_fails_when_socket_fails(self) -> None:
         connection = self.init_local_connection()
 
@@ -42,9 +155,147 @@ class TestSumoTcpConnection:
             with pytest.raises(SumoTcpConnection.SumoSocketError):
                 connection.connect()
 
-    def test_get_socket_succeeds(self) -> None:
+    def test_from_socket_adopts_connected_socket(self) -> None:
+        left, right = socket.socketpair()
+
+        try:
+            connection = SumoTcpConnection.from_socket(left)
+            peer = SumoTcpConnection.from_socket(right)
+
+            connection.send_message(b"abc")
+
+            assert connection.socket is left
+            assert peer.recv_message() == b"abc"
+        finally:
+            left.close()
+            right.close()
+
+    def test_acquire_connects_new_connection(self) -> None:
+        SumoTcpConnection._pool.clear()
+
+        with mock.patch("socket.socket.connect") as mock_connect:
+            connection = SumoTcpConnection.acquire(self.LOCAL_HOST, self.PORT_NUMBER)
+
+        assert connection.address == (self.LOCAL_HOST, self.PORT_NUMBER)
+        mock_connect.assert_called_once()
+
+    def test_acquire_reuses_released_connection(self) -> None:
+        SumoTcpConnection._pool.clear()
+        connection = self.init_local_connection()
+
+        connection.release()
+        with mock.patch("socket.socket.connect") as mock_connect:
+            reacquired = SumoTcpConnection.acquire(self.LOCAL_HOST, self.PORT_NUMBER)
+
+        assert reacquired is connection
+        assert not SumoTcpConnection._pool
+        mock_connect.assert_not_called()
+
+    def test_send_message_batches_header_and_payload(self) -> None:
+        connection = self.init_connected_connection()
+
+        with mock.patch("socket.socket.sendmsg", side_effect=full_sendmsg) as mock_sendmsg:
+            connection.send_message(b"abc")
+
+        mock_sendmsg.assert_called_once_with([b"\x00\x00\x00\x03", b"abc"])
+
+    def test_send_message_completes_after_short_write(self) -> None:
+        connection = self.init_connected_connection()
+
+        with mock.patch("socket.socket.sendmsg", return_value=2), \
+                mock.patch("socket.socket.sendall") as mock_sendall:
+            connection.send_message(b"abc")
+
+        (tail,) = mock_sendall.call_args.args
+        assert bytes(tail) == b"\x00\x03abc"
+
+    def test_send_message_fails_when_socket_fails(self) -> None:
+        connection = self.init_connected_connection()
+
+        with mock.patch("socket.socket.sendmsg", side_effect=OSError):
+            with pytest.raises(SumoTcpConnection.SumoSocketError):
+                connection.send_message(b"abc")
+
+    def test_send_batch_sends_all_payloads_in_one_call(self) -> None:
+        connection = self.init_connected_connection()
+
+        with mock.patch("socket.socket.sendmsg", side_effect=full_sendmsg) as mock_sendmsg:
+            connection.send_batch([b"one", b"two", b"three"])
+
+        mock_sendmsg.assert_called_once_with([b"one", b"two", b"three"])
+
+    def test_send_batch_fails_when_socket_fails(self) -> None:
+        connection = self.init_connected_connection()
+
+        with mock.patch("socket.socket.sendmsg", side_effect=OSError):
+            with pytest.raises(SumoTcpConnection.SumoSocketError):
+                connection.send_batch([b"one", b"two"])
+
+    def test_send_batch_skips_empty_batches(self) -> None:
+        connection = self.init_connected_connection()
+
+        with mock.patch("socket.socket.sendmsg") as mock_sendmsg:
+            connection.send_batch([])
+
+        mock_sendmsg.assert_not_called()
+
+    def test_recv_message_returns_payload(self) -> None:
+        connection = self.init_connected_connection()
+        chunks = collections.deque([b"\x00\x00\x00\x03", b"abc"])
+
+        def recv_into(view: memoryview) -> int:
+            chunk = chunks.popleft()
+            view[: len(chunk)] = chunk
+            return len(chunk)
+
+        with mock.patch("socket.socket.recv_into", side_effect=recv_into):
+            assert connection.recv_message() == b"abc"
+
+    def test_recv_message_grows_buffer_for_large_payloads(self) -> None:
+        connection = self.init_connected_connection()
+        payload = b"x" * (SumoTcpConnection._INITIAL_RECEIVE_BUFFER_SIZE + 1)
+        chunks = collections.deque([SumoTcpConnection._MESSAGE_HEADER.pack(len(payload)), payload])
+
+        def recv_into(view: memoryview) -> int:
+            chunk = chunks.popleft()
+            view[: len(chunk)] = chunk
+            return len(chunk)
+
+        with mock.patch("socket.socket.recv_into", side_effect=recv_into):
+            assert connection.recv_message() == payload
+
+        assert len(connection._receive_buffer) == len(payload)
+
+    def test_recv_message_fails_when_connection_closed(self) -> None:
+        connection = self.init_connected_connection()
+
+        with mock.patch("socket.socket.recv_into", return_value=0):
+            with pytest.raises(SumoTcpConnection.SumoSocketError, match="closed"):
+                connection.recv_message()
+
+    def test_connect_async_succeeds(self) -> None:
         connection = self.init_local_connection()
-        assert connection.socket is not None
+
+        with mock.patch("asyncio.selector_events.BaseSelectorEventLoop.sock_connect", new_callable=mock.AsyncMock):
+            asyncio.run(connection.connect_async())
+
+    def test_connect_async_fails_when_socket_fails(self) -> None:
+        connection = self.init_local_connection()
+
+        with mock.patch(
+            "asyncio.selector_events.BaseSelectorEventLoop.sock_connect",
+            new_callable=mock.AsyncMock,
+        ) as mock_connect:
+            mock_connect.side_effect = OSError
+
+            with pytest.raises(SumoTcpConnection.SumoSocketError):
+                asyncio.run(connection.connect_async())
+
+    def test_get_socket_fails_before_connect(self) -> None:
+        connection = self.init_local_connection()
+
+        with pytest.raises(SumoTcpConnection.SumoSocketError, match="until the connection is established"):
+            connection.socket
 
     def test_get_socket_succeeds_when_established(self) -> None:
         connection = self.init_local_connection()
@@ -52,3 +303,154 @@ class TestSumoTcpConnection:
         with mock.patch("socket.socket.connect"):
             connection.connect()
             connection.socket
+
+    def test_get_reader_fails_before_connect(self) -> None:
+        connection = self.init_local_connection()
+
+        with pytest.raises(SumoTcpConnection.SumoSocketError, match="until the connection is established"):
+            connection.reader
+
+    def test_get_writer_fails_before_connect(self) -> None:
+        connection = self.init_local_connection()
+
+        with pytest.raises(SumoTcpConnection.SumoSocketError, match="until the connection is established"):
+            connection.writer
+
+    def test_reader_and_writer_are_buffered_and_reused(self) -> None:
+        connection = self.init_connected_connection()
+
+        assert isinstance(connection.reader, io.BufferedReader)
+        assert isinstance(connection.writer, io.BufferedWriter)
+        assert connection.reader is connection.reader
+        assert connection.writer is connection.writer
+
+
+class TestSumoMuxConnection:
+    LOCAL_HOST: Final[ipaddress.IPv4Address] = ipaddress.IPv4Address("127.0.0.1")
+    PORT_NUMBER: Final[int] = 8800
+
+    def init_mux_connection(self) -> SumoMuxConnection:
+        host = self.LOCAL_HOST
+        port = self.PORT_NUMBER
+        return SumoMuxConnection(host, port)
+
+    def test_init_succeeds(self) -> None:
+        self.init_mux_connection()
+
+    def test_get_connection_succeeds(self) -> None:
+        mux = self.init_mux_connection()
+        assert mux.connection is not None
+
+    def test_connect_connects_underlying_connection(self) -> None:
+        mux = self.init_mux_connection()
+
+        with mock.patch.object(mux.connection, "connect") as mock_connect:
+            mux.connect()
+
+        mock_connect.assert_called_once()
+
+    def test_open_channel_assigns_unique_ids(self) -> None:
+        mux = self.init_mux_connection()
+
+        assert mux.open_channel() != mux.open_channel()
+
+    def test_close_channel_succeeds(self) -> None:
+        mux = self.init_mux_connection()
+
+        channel_id = mux.open_channel()
+        mux.close_channel(channel_id)
+
+        with pytest.raises(SumoMuxConnection.SumoChannelError, match="does not exist"):
+            mux.receive(channel_id)
+
+    def test_close_channel_fails_when_nonexistent(self) -> None:
+        mux = self.init_mux_connection()
+
+        with pytest.raises(SumoMuxConnection.SumoChannelError, match="does not exist"):
+            mux.close_channel(0)
+
+    def test_send_fails_when_nonexistent_channel(self) -> None:
+        mux = self.init_mux_connection()
+
+        with pytest.raises(SumoMuxConnection.SumoChannelError, match="does not exist"):
+            mux.send(0, b"payload")
+
+    def test_flush_sends_batched_frames_in_one_call(self) -> None:
+        mux = self.init_mux_connection()
+        first_channel = mux.open_channel()
+        second_channel = mux.open_channel()
+
+        with mock.patch.object(mux.connection, "_socket") as mock_socket:
+            mock_socket.sendmsg.side_effect = full_sendmsg
+            mux.send(first_channel, b"first")
+            mux.send(second_channel, b"second")
+            mux.flush()
+
+            mock_socket.sendmsg.assert_called_once_with(
+                [
+                    SumoMuxConnection._FRAME_HEADER.pack(first_channel, len(b"first")),
+                    b"first",
+                    SumoMuxConnection._FRAME_HEADER.pack(second_channel, len(b"second")),
+                    b"second",
+                ],
+            )
+
+    def test_flush_fails_when_socket_fails(self) -> None:
+        mux = self.init_mux_connection()
+        channel_id = mux.open_channel()
+
+        with mock.patch.object(mux.connection, "_socket") as mock_socket:
+            mock_socket.sendmsg.side_effect = OSError
+            mux.send(channel_id, b"payload")
+
+            with pytest.raises(SumoTcpConnection.SumoSocketError):
+                mux.flush()
+
+    def test_flush_without_frames_does_nothing(self) -> None:
+        mux = self.init_mux_connection()
+
+        with mock.patch.object(mux.connection, "_socket") as mock_socket:
+            mux.flush()
+
+            mock_socket.sendmsg.assert_not_called()
+
+    def test_pump_routes_frame_to_channel(self) -> None:
+        mux = self.init_mux_connection()
+        channel_id = mux.open_channel()
+
+        with mock.patch.object(mux.connection, "_socket") as mock_socket:
+            mock_socket.recv.side_effect = [
+                SumoMuxConnection._FRAME_HEADER.pack(channel_id, len(b"payload")),
+                b"payload",
+            ]
+            mux.pump()
+
+        assert mux.receive(channel_id) == b"payload"
+
+    def test_pump_fails_when_nonexistent_channel(self) -> None:
+        mux = self.init_mux_connection()
+
+        with mock.patch.object(mux.connection, "_socket") as mock_socket:
+            mock_socket.recv.side_effect = [
+                SumoMuxConnection._FRAME_HEADER.pack(0, len(b"payload")),
+                b"payload",
+            ]
+
+            with pytest.raises(SumoMuxConnection.SumoChannelError, match="nonexistent"):
+                mux.pump()
+
+    def test_pump_fails_when_connection_closes_mid_frame(self) -> None:
+        mux = self.init_mux_connection()
+        mux.open_channel()
+
+        with mock.patch.object(mux.connection, "_socket") as mock_socket:
+            mock_socket.recv.return_value = b""
+
+            with pytest.raises(SumoTcpConnection.SumoSocketError, match="closed"):
+                mux.pump()
+
+    def test_receive_returns_none_when_queue_empty(self) -> None:
+        mux = self.init_mux_connection()
+        channel_id = mux.open_channel()
+
+        assert mux.receive(channel_id) is None